@@ -0,0 +1,413 @@
+"""Benchmark coordinator refreshes against the local fake TeamSnap API.
+
+Usage::
+
+    python -m benchmarks.bench_refresh --teams 20 --events 200
+    python -m benchmarks.bench_refresh --output results.json
+    python -m benchmarks.bench_refresh --baseline results.json
+
+Each scenario reports wall time, requests, bytes sent and decoded, peak
+traced memory and the longest stretch the event loop was blocked. Requests
+are not paced unless ``--rate`` or ``--paced`` is given, so wall time
+measures the integration's code rather than its rate limiter. Compare
+runs with ``--offload-threshold 0`` (decode every response in the executor)
+and a large threshold (never) to see what off-loop decoding buys, or with
+``--fetch-profile full`` and ``minimal`` to see what payload trimming saves.
+With ``--baseline`` the run fails when requests or bytes grow past
+``--tolerance``, or wall time past ``--time-tolerance``, so it can gate CI.
+Every run also fails if rescheduling one event re-downloads availability
+for more than that event's team.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable
+from dataclasses import asdict, dataclass
+import json
+import logging
+from pathlib import Path
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from aiohttp import ClientResponse, ClientSession
+from homeassistant.core import HomeAssistant
+
+from custom_components.teamsnap.api import TeamSnapAPIClient
+from custom_components.teamsnap.const import (
+    API_BASE_URL,
+    AVAILABILITY_DAYS,
+    FETCH_PROFILE_FULL,
+    FETCH_PROFILE_MINIMAL,
+)
+from custom_components.teamsnap.coordinator import TeamSnapDataUpdateCoordinator
+from custom_components.teamsnap.ratelimit import TokenBucket
+from custom_components.teamsnap.sensor import (
+    SENSOR_DESCRIPTIONS,
+    TeamSnapSensor,
+    TeamSnapTeamSensor,
+)
+
+from .fake_server import API_PREFIX, FakeServerConfig, FakeTeamSnapServer
+
+# Counters compared against a baseline, and how each is judged
+_COUNT_METRICS = ("requests", "bytes", "decoded_bytes")
+# How often the stall probe expects to be woken, in seconds
+_STALL_TICK = 0.001
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements of one benchmark scenario."""
+
+    name: str
+    wall_time: float
+    requests: int
+    bytes: int
+    peak_memory: int
+    max_stall: float = 0.0
+    detail: str = ""
+    decoded_bytes: int = 0
+
+
+class _Unlimited:
+    """Rate limiter that never waits."""
+
+    async def acquire(self) -> None:
+        """Return at once."""
+
+
+class LocalSession:
+    """Stand-in for the OAuth2 session that sends requests to the fake API."""
+
+    def __init__(self, session: ClientSession, base_url: str) -> None:
+        """Initialize the session."""
+        self._session = session
+        self._base_url = base_url
+
+    async def async_request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> ClientResponse:
+        """Send a request, rewriting the real API host to the fake one."""
+        if url.startswith(API_BASE_URL):
+            url = self._base_url + url[len(API_BASE_URL) :]
+        return await self._session.request(method, url, **kwargs)
+
+
+class Benchmark:
+    """Run refresh scenarios against one fake server."""
+
+    def __init__(
+        self,
+        config: FakeServerConfig,
+        rate: float | None,
+        trace_memory: bool,
+        offload_threshold: int | None = None,
+        fetch_profile: str | None = None,
+    ) -> None:
+        """Initialize the benchmark."""
+        self.server = FakeTeamSnapServer(config)
+        self._rate = rate
+        self._trace_memory = trace_memory
+        self._offload_threshold = offload_threshold
+        self._fetch_profile = fetch_profile
+        self.results: list[ScenarioResult] = []
+        self.failures: list[str] = []
+
+    async def run(self) -> list[ScenarioResult]:
+        """Run every scenario and return the results."""
+        base_url = await self.server.start()
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(config_dir)
+            async with ClientSession() as session:
+                coordinator = self._coordinator(hass, LocalSession(session, base_url))
+
+                await self._measure("cold refresh", self._refresh(coordinator))
+                await self._measure("warm refresh", self._refresh(coordinator))
+                changed = self.server.mutate(10)
+                await self._measure(
+                    "delta refresh",
+                    self._refresh(coordinator),
+                    f"{len(changed)} events moved",
+                )
+                await self._measure_sensors(coordinator)
+                moved = self.server.postpone_next(AVAILABILITY_DAYS + 1)
+                await self._measure(
+                    "reschedule",
+                    self._refresh(coordinator),
+                    f"event {moved} left the availability window",
+                )
+                self._check_availability_chunks()
+        await self.server.stop()
+        return self.results
+
+    def _coordinator(
+        self, hass: HomeAssistant, session: LocalSession
+    ) -> TeamSnapDataUpdateCoordinator:
+        """Create a coordinator whose client talks to the fake server.
+
+        A rate of 0 keeps the integration's own limiter; None sends requests
+        as fast as they come.
+        """
+        rate_limiter: TokenBucket | _Unlimited | None = None
+        if self._rate is None:
+            rate_limiter = _Unlimited()
+        elif self._rate:
+            rate_limiter = TokenBucket(rate=self._rate, burst=max(1, int(self._rate)))
+        client = TeamSnapAPIClient(
+            session, rate_limiter=rate_limiter  # type: ignore[arg-type]
+        )
+        if self._offload_threshold is not None:
+            client.offload_threshold = self._offload_threshold
+        if self._fetch_profile is not None:
+            client.fetch_profile = self._fetch_profile
+        return TeamSnapDataUpdateCoordinator(hass, client)
+
+    @staticmethod
+    async def _refresh(coordinator: TeamSnapDataUpdateCoordinator) -> str:
+        """Run one refresh the way the coordinator's timer would."""
+        coordinator.data = await coordinator._async_update_data()
+        record = coordinator.api_client.metrics.last_refresh
+        assert record is not None
+        return (
+            f"{len(coordinator.timeline)} events indexed; "
+            f"network {record.network:.3f}s, decode {record.decode:.3f}s "
+            f"(+{record.offloaded:.3f}s off-loop), "
+            f"processing {record.index_time + record.views_time:.3f}s"
+        )
+
+    async def _measure(
+        self,
+        name: str,
+        work: Awaitable[str | None],
+        detail: str = "",
+    ) -> None:
+        """Measure one awaitable and record the result."""
+        self.server.stats.reset()
+        if self._trace_memory:
+            tracemalloc.start()
+        max_stall = 0.0
+
+        async def _probe() -> None:
+            nonlocal max_stall
+            while True:
+                tick = time.perf_counter()
+                await asyncio.sleep(_STALL_TICK)
+                max_stall = max(max_stall, time.perf_counter() - tick - _STALL_TICK)
+
+        probe = asyncio.create_task(_probe())
+        start = time.perf_counter()
+        outcome = await work
+        wall_time = time.perf_counter() - start
+        probe.cancel()
+        peak = 0
+        if self._trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        self.results.append(
+            ScenarioResult(
+                name,
+                wall_time,
+                self.server.stats.requests,
+                self.server.stats.bytes_sent,
+                peak,
+                max_stall,
+                ", ".join(part for part in (detail, outcome or "") if part),
+                self.server.stats.bytes_decoded,
+            )
+        )
+
+    def _check_availability_chunks(self) -> None:
+        """Fail unless only the rescheduled team's availability was refetched.
+
+        Availability chunks are per team, so every other team's chunk keeps
+        its URL and should be answered with a 304.
+        """
+        # A chunk may span several pages, which share its event_id list
+        chunks = len(
+            {
+                url.query["event_id"]
+                for url in self.server.stats.downloads
+                if url.path == f"{API_PREFIX}/availabilities/search"
+            }
+        )
+        self.results[-1].detail += f", {chunks} availability chunks refetched"
+        if chunks > 1:
+            self.failures.append(
+                f"reschedule: {chunks} availability chunks refetched, "
+                "expected at most 1"
+            )
+
+    async def _measure_sensors(
+        self, coordinator: TeamSnapDataUpdateCoordinator
+    ) -> None:
+        """Measure entity updates and property reads after a refresh."""
+        entities: list[TeamSnapSensor] = [
+            TeamSnapSensor(coordinator, description)
+            for description in SENSOR_DESCRIPTIONS
+        ]
+        for team in coordinator.teams:
+            entities.extend(
+                TeamSnapTeamSensor(coordinator, description, team)
+                for description in SENSOR_DESCRIPTIONS
+            )
+        writes = 0
+
+        def _count_write() -> None:
+            nonlocal writes
+            writes += 1
+
+        for entity in entities:
+            # Only the state write is counted; HA itself is not benchmarked
+            entity.async_write_ha_state = _count_write  # type: ignore[method-assign]
+
+        async def _update_and_read() -> str:
+            await self._refresh(coordinator)
+            for entity in entities:
+                entity._handle_coordinator_update()
+                entity.native_value  # noqa: B018
+                entity.extra_state_attributes  # noqa: B018
+            return f"{len(entities)} sensors, {writes} state writes"
+
+        await self._measure("sensor update", _update_and_read())
+
+
+def compare(
+    results: list[ScenarioResult],
+    baseline: list[dict[str, Any]],
+    tolerance: float,
+    time_tolerance: float,
+) -> list[str]:
+    """Return a description of every metric that regressed."""
+    previous = {result["name"]: result for result in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(result.name)
+        if before is None:
+            continue
+        limits: list[tuple[str, float]] = [
+            (metric, tolerance) for metric in _COUNT_METRICS
+        ]
+        limits.append(("wall_time", time_tolerance))
+        for metric, allowed in limits:
+            # Baselines saved before a metric existed skip it
+            old, new = before.get(metric), getattr(result, metric)
+            if old and new > old * (1 + allowed):
+                regressions.append(
+                    f"{result.name}: {metric} {old} -> {new} "
+                    f"(+{(new / old - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def print_table(results: list[ScenarioResult]) -> None:
+    """Print results as a plain text table."""
+    print(
+        f"{'scenario':<16} {'wall (s)':>9} {'requests':>9} "
+        f"{'bytes':>10} {'decoded':>10} {'peak mem':>10} {'stall (s)':>9}  detail"
+    )
+    for result in results:
+        print(
+            f"{result.name:<16} {result.wall_time:>9.3f} {result.requests:>9} "
+            f"{result.bytes:>10} {result.decoded_bytes:>10} {result.peak_memory:>10} "
+            f"{result.max_stall:>9.3f}  {result.detail}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, default=5)
+    parser.add_argument("--events", type=int, default=120, help="events per team")
+    parser.add_argument(
+        "--page-size", type=int, default=1000, help="largest page served"
+    )
+    parser.add_argument(
+        "--no-compression", action="store_true", help="never gzip responses"
+    )
+    parser.add_argument(
+        "--fetch-profile",
+        choices=(FETCH_PROFILE_MINIMAL, FETCH_PROFILE_FULL),
+        default=None,
+        help="client fetch profile (default: the integration's)",
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--rate-limit-every", type=int, default=0, help="answer every Nth with 429"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=None,
+        help="client requests per second (default: unlimited)",
+    )
+    parser.add_argument(
+        "--paced",
+        action="store_true",
+        help="pace requests with the integration's own rate limiter",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--offload-threshold",
+        type=int,
+        default=None,
+        help="decode bodies of at least this many bytes off the event loop",
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip tracemalloc (faster)"
+    )
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="compare with saved results")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--time-tolerance", type=float, default=1.0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    config = FakeServerConfig(
+        teams=args.teams,
+        events_per_team=args.events,
+        max_page_size=args.page_size,
+        compress=not args.no_compression,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit_every=args.rate_limit_every,
+        seed=args.seed,
+    )
+    benchmark = Benchmark(
+        config,
+        0 if args.paced else args.rate,
+        not args.no_memory,
+        args.offload_threshold,
+        args.fetch_profile,
+    )
+    results = asyncio.run(benchmark.run())
+    print_table(results)
+    for failure in benchmark.failures:
+        print(f"FAILED {failure}", file=sys.stderr)
+
+    if args.output:
+        args.output.write_text(
+            json.dumps([asdict(result) for result in results], indent=2) + "\n"
+        )
+    if args.baseline:
+        regressions = compare(
+            results,
+            json.loads(args.baseline.read_text()),
+            args.tolerance,
+            args.time_tolerance,
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 1 if benchmark.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
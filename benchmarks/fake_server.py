@@ -0,0 +1,356 @@
+"""Local stand-in for the TeamSnap v3 API.
+
+Serves synthetic Collection+JSON for a configurable number of teams and
+events, with optional latency, server errors, 429 responses and paging,
+so refreshes can be measured without network access or an account. Bodies
+are gzipped for clients that accept it, and searches honour a ``fields``
+list like the sparse fieldsets some API deployments offer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import gzip
+import hashlib
+import json
+import random
+from typing import Any
+
+from aiohttp import web
+from yarl import URL
+
+API_PREFIX = "/v3"
+MEMBERS_PER_TEAM = 12
+
+
+@dataclass
+class FakeServerConfig:
+    """Shape of the synthetic account and the faults to inject."""
+
+    teams: int = 5
+    events_per_team: int = 120
+    past_days: int = 7
+    future_days: int = 120
+    # Largest page served, whatever page_size the client asks for
+    max_page_size: int = 1000
+    # Gzip bodies when the client sends Accept-Encoding: gzip
+    compress: bool = True
+    latency: float = 0.0
+    # Share of requests answered with a 503
+    error_rate: float = 0.0
+    # Every Nth request is answered with a 429 (0 disables)
+    rate_limit_every: int = 0
+    seed: int = 1
+
+
+@dataclass
+class FakeServerStats:
+    """What the server has served so far."""
+
+    requests: int = 0
+    # As sent, after any compression
+    bytes_sent: int = 0
+    bytes_decoded: int = 0
+    not_modified: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    # Requests answered with a body rather than a 304
+    downloads: list[URL] = field(default_factory=list)
+
+    def reset(self) -> None:
+        """Zero every counter."""
+        self.requests = self.bytes_sent = self.bytes_decoded = 0
+        self.not_modified = 0
+        self.errors = self.rate_limited = 0
+        self.downloads.clear()
+
+
+class FakeTeamSnapServer:
+    """aiohttp application serving a synthetic TeamSnap account."""
+
+    def __init__(self, config: FakeServerConfig | None = None) -> None:
+        """Generate the account described by the config."""
+        self.config = config or FakeServerConfig()
+        self.stats = FakeServerStats()
+        self._random = random.Random(self.config.seed)
+        self._now = datetime.now(timezone.utc).replace(microsecond=0)
+        self.teams = [
+            {"id": team_id, "name": f"Team {team_id}"}
+            for team_id in range(1, self.config.teams + 1)
+        ]
+        self.events: dict[int, dict[str, Any]] = {}
+        for team in self.teams:
+            for index in range(self.config.events_per_team):
+                event = self._new_event(team["id"], index)
+                self.events[event["id"]] = event
+        self.base_url = ""
+        self._runner: web.AppRunner | None = None
+
+    def _new_event(self, team_id: int, index: int) -> dict[str, Any]:
+        """Create one synthetic event spread over the configured window."""
+        span = (self.config.past_days + self.config.future_days) * 24
+        start = self._now + timedelta(
+            hours=self._random.randrange(span) - self.config.past_days * 24
+        )
+        is_game = index % 3 == 0
+        return {
+            "id": team_id * 100000 + index,
+            "team_id": team_id,
+            "name": f"{'Game' if is_game else 'Practice'} {index}",
+            "event_type": "game" if is_game else "practice",
+            "is_game": is_game,
+            "start_date": start.isoformat(),
+            "duration_in_minutes": 90 if is_game else 60,
+            "location_name": f"Field {index % 7}",
+            "opponent_name": f"Opponent {index % 11}" if is_game else None,
+            # Long settled, so only mutated events show up in delta syncs
+            "updated_at": (self._now - timedelta(days=30)).isoformat(),
+        }
+
+    def mutate(self, count: int) -> list[int]:
+        """Reschedule ``count`` random events and return their ids."""
+        self._now = max(
+            datetime.now(timezone.utc).replace(microsecond=0),
+            self._now + timedelta(seconds=1),
+        )
+        changed = self._random.sample(sorted(self.events), min(count, len(self.events)))
+        for event_id in changed:
+            event = self.events[event_id]
+            start = datetime.fromisoformat(event["start_date"]) + timedelta(hours=1)
+            event["start_date"] = start.isoformat()
+            event["updated_at"] = self._now.isoformat()
+        return changed
+
+    def postpone_next(self, days: int) -> int:
+        """Move the next upcoming event ``days`` later and return its id."""
+        self._now = max(
+            datetime.now(timezone.utc).replace(microsecond=0),
+            self._now + timedelta(seconds=1),
+        )
+        event = min(
+            (
+                event
+                for event in self.events.values()
+                if datetime.fromisoformat(event["start_date"]) > self._now
+            ),
+            key=lambda event: event["start_date"],
+        )
+        start = datetime.fromisoformat(event["start_date"]) + timedelta(days=days)
+        event["start_date"] = start.isoformat()
+        event["updated_at"] = self._now.isoformat()
+        return int(event["id"])
+
+    async def start(self) -> str:
+        """Serve on a free local port and return the API base URL."""
+        app = web.Application(middlewares=[self._faults])
+        app.router.add_get(f"{API_PREFIX}/", self._root)
+        app.router.add_get(f"{API_PREFIX}/me", self._me)
+        app.router.add_get(f"{API_PREFIX}/teams", self._teams)
+        app.router.add_get(f"{API_PREFIX}/teams/{{team_id}}/events", self._team_events)
+        app.router.add_get(f"{API_PREFIX}/events/search", self._search_events)
+        app.router.add_get(f"{API_PREFIX}/events/{{event_id}}", self._event)
+        app.router.add_get(
+            f"{API_PREFIX}/availabilities/search", self._search_availabilities
+        )
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        self.base_url = f"http://127.0.0.1:{port}{API_PREFIX}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _faults(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        """Apply latency and injected failures, and count traffic."""
+        self.stats.requests += 1
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+        every = self.config.rate_limit_every
+        if every and self.stats.requests % every == 0:
+            self.stats.rate_limited += 1
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        if self.config.error_rate and self._random.random() < self.config.error_rate:
+            self.stats.errors += 1
+            return web.Response(status=503)
+
+        response = await handler(request)
+        if isinstance(response, web.Response) and response.body is not None:
+            self.stats.bytes_sent += len(response.body)  # type: ignore[arg-type]
+        return response
+
+    def _collection(
+        self,
+        request: web.Request,
+        items: list[dict[str, Any]],
+        links: list[dict[str, str]] | None = None,
+        queries: list[dict[str, Any]] | None = None,
+    ) -> web.Response:
+        """Serve one page of items as Collection+JSON with an ETag."""
+        page_size = min(
+            int(request.query.get("page_size", self.config.max_page_size)),
+            self.config.max_page_size,
+        )
+        page_number = int(request.query.get("page_number", 1))
+        first = (page_number - 1) * page_size
+        page = items[first : first + page_size]
+        if "fields" in request.query:
+            fields = request.query["fields"].split(",")
+            page = [
+                {name: item[name] for name in fields if name in item}
+                for item in page
+            ]
+        links = list(links or [])
+        if first + page_size < len(items):
+            query = {**request.query, "page_size": page_size}
+            query["page_number"] = page_number + 1
+            links.append(
+                {
+                    "rel": "next",
+                    "href": str(request.url.with_query(query)),
+                }
+            )
+        document = {
+            "collection": {
+                "version": "3.866.0",
+                "href": str(request.url),
+                "links": links,
+                "queries": queries or [],
+                "items": [
+                    {
+                        "data": [
+                            {"name": name, "value": value}
+                            for name, value in item.items()
+                        ]
+                    }
+                    for item in page
+                ],
+            }
+        }
+        body = json.dumps(document).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.stats.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        self.stats.bytes_decoded += len(body)
+        self.stats.downloads.append(request.rel_url)
+        headers = {"ETag": etag}
+        if self.config.compress and "gzip" in request.headers.get(
+            "Accept-Encoding", ""
+        ):
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+        return web.Response(
+            body=body,
+            content_type="application/vnd.collection+json",
+            headers=headers,
+        )
+
+    def _filter_events(
+        self, request: web.Request, team_ids: set[int]
+    ) -> list[dict[str, Any]]:
+        """Return the events of some teams matching the request filters."""
+        query = request.query
+        started_after = _parse(query.get("started_after"))
+        started_before = _parse(query.get("started_before"))
+        updated_since = _parse(query.get("updated_since"))
+        events = []
+        for event in self.events.values():
+            if event["team_id"] not in team_ids:
+                continue
+            start = datetime.fromisoformat(event["start_date"])
+            if started_after and start < started_after:
+                continue
+            if started_before and start > started_before:
+                continue
+            updated = datetime.fromisoformat(event["updated_at"])
+            if updated_since and updated <= updated_since:
+                continue
+            events.append(event)
+        return events
+
+    async def _root(self, request: web.Request) -> web.Response:
+        """Serve the hypermedia root."""
+        base = f"{request.url.origin()}{API_PREFIX}"
+        links = [
+            {"rel": rel, "href": f"{base}/{rel}"}
+            for rel in ("me", "teams", "events", "availabilities")
+        ]
+        queries = [
+            {
+                "rel": "events_search",
+                "href": f"{base}/events/search",
+                "data": [
+                    {"name": name, "value": None}
+                    for name in (
+                        "team_id",
+                        "started_after",
+                        "started_before",
+                        "updated_since",
+                        "fields",
+                    )
+                ],
+            },
+            {
+                "rel": "availabilities_search",
+                "href": f"{base}/availabilities/search",
+                "data": [
+                    {"name": name, "value": None} for name in ("event_id", "fields")
+                ],
+            },
+        ]
+        return self._collection(request, [], links, queries)
+
+    async def _me(self, request: web.Request) -> web.Response:
+        """Serve the authenticated user."""
+        return self._collection(request, [{"id": 1, "first_name": "Bench"}])
+
+    async def _teams(self, request: web.Request) -> web.Response:
+        """Serve the team list."""
+        return self._collection(request, self.teams)
+
+    async def _team_events(self, request: web.Request) -> web.Response:
+        """Serve one team's events."""
+        team_id = int(request.match_info["team_id"])
+        return self._collection(request, self._filter_events(request, {team_id}))
+
+    async def _search_events(self, request: web.Request) -> web.Response:
+        """Serve an event search over a comma-separated team_id list."""
+        team_ids = {int(value) for value in request.query["team_id"].split(",")}
+        return self._collection(request, self._filter_events(request, team_ids))
+
+    async def _event(self, request: web.Request) -> web.Response:
+        """Serve one event."""
+        event = self.events.get(int(request.match_info["event_id"]))
+        if event is None:
+            return web.Response(status=404)
+        return self._collection(request, [event])
+
+    async def _search_availabilities(self, request: web.Request) -> web.Response:
+        """Serve availabilities for a comma-separated event_id list."""
+        items = []
+        for value in request.query["event_id"].split(","):
+            event_id = int(value)
+            for member in range(MEMBERS_PER_TEAM):
+                status = (event_id + member) % 4
+                items.append(
+                    {
+                        "event_id": event_id,
+                        "member_id": member,
+                        "status_code": status if status < 3 else None,
+                    }
+                )
+        return self._collection(request, items)
+
+
+def _parse(value: str | None) -> datetime | None:
+    """Parse an ISO timestamp query parameter."""
+    return datetime.fromisoformat(value) if value else None
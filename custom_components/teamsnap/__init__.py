@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import time
 import logging
 from typing import Any
 
@@ -9,14 +10,51 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_entry_oauth2_flow
-
-from .api import TeamSnapAPIClient
-from .const import DOMAIN
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_FETCH_CONCURRENCY,
+    CONF_FETCH_PROFILE,
+    CONF_MAX_EVENTS_PER_TEAM,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_OFFLOAD_THRESHOLD,
+    CONF_QUIET_HOURS_END,
+    CONF_QUIET_HOURS_START,
+    CONF_SYNC_FUTURE_DAYS,
+    CONF_SYNC_PAST_DAYS,
+    DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_FETCH_PROFILE,
+    DEFAULT_MAX_EVENTS_PER_TEAM,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_OFFLOAD_THRESHOLD,
+    DEFAULT_SYNC_FUTURE_DAYS,
+    DEFAULT_SYNC_PAST_DAYS,
+    DATA_REGISTRY,
+    DOMAIN,
+)
 from .coordinator import TeamSnapDataUpdateCoordinator
+from .retention import EventRetention
+from .scheduler import PollScheduler
+from .services import async_setup_services
+from .shared import async_get_registry
+from .store import TeamSnapSnapshotStore
+from .sync import TeamSnapEventSync
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.CALENDAR, Platform.SENSOR]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the TeamSnap services."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -31,37 +69,104 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Failed to get OAuth2 implementation: %s", err)
         return False
 
+    options = entry.options
     try:
         oauth_session = config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation)
-        api_client = TeamSnapAPIClient(oauth_session)
-        coordinator = TeamSnapDataUpdateCoordinator(hass, api_client)
+        registry = async_get_registry(hass)
+        api_client = registry.create_client(oauth_session)
+        api_client.offload_threshold = 1024 * int(
+            options.get(CONF_OFFLOAD_THRESHOLD, DEFAULT_OFFLOAD_THRESHOLD)
+        )
+        api_client.fetch_profile = options.get(
+            CONF_FETCH_PROFILE, DEFAULT_FETCH_PROFILE
+        )
+        coordinator = TeamSnapDataUpdateCoordinator(
+            hass,
+            api_client,
+            fetch_concurrency=int(
+                options.get(CONF_FETCH_CONCURRENCY, DEFAULT_FETCH_CONCURRENCY)
+            ),
+            event_sync=TeamSnapEventSync(
+                api_client,
+                past_days=int(
+                    options.get(CONF_SYNC_PAST_DAYS, DEFAULT_SYNC_PAST_DAYS)
+                ),
+                future_days=int(
+                    options.get(CONF_SYNC_FUTURE_DAYS, DEFAULT_SYNC_FUTURE_DAYS)
+                ),
+            ),
+            retention=EventRetention(
+                int(
+                    options.get(CONF_MAX_EVENTS_PER_TEAM, DEFAULT_MAX_EVENTS_PER_TEAM)
+                )
+            ),
+            snapshot=TeamSnapSnapshotStore(hass, entry.entry_id),
+            registry=registry,
+            scheduler=PollScheduler(
+                min_interval=int(
+                    options.get(CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL)
+                ),
+                max_interval=int(
+                    options.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL)
+                ),
+                quiet_start=_parse_time(options.get(CONF_QUIET_HOURS_START)),
+                quiet_end=_parse_time(options.get(CONF_QUIET_HOURS_END)),
+            ),
+        )
     except Exception as err:
         _LOGGER.error("Failed to initialize TeamSnap client: %s", err)
         return False
 
-    # Fetch initial data so we have data when entities are added
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        _LOGGER.warning(
-            "Failed to fetch initial data from TeamSnap: %s. "
-            "The integration will continue to retry.",
-            err
+    if await coordinator.async_restore_snapshot():
+        # Entities start from the saved snapshot; revalidate in the background
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} initial refresh"
         )
-        # Don't fail setup if initial fetch fails - coordinator will retry
+    else:
+        # Fetch initial data so we have data when entities are added
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception as err:
+            _LOGGER.warning(
+                "Failed to fetch initial data from TeamSnap: %s. "
+                "The integration will continue to retry.",
+                err
+            )
+            # Don't fail setup if initial fetch fails - coordinator will retry
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+def _parse_time(value: str | None) -> time | None:
+    """Parse an optional "HH:MM[:SS]" option value."""
+    if not value:
+        return None
+    return dt_util.parse_time(value)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        if hass.data[DOMAIN].keys() <= {DATA_REGISTRY}:
+            # Last entry gone, drop the shared registry with it
+            hass.data.pop(DOMAIN)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the saved snapshot when a config entry is deleted."""
+    await TeamSnapSnapshotStore(hass, entry.entry_id).async_remove()
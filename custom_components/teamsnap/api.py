@@ -3,15 +3,67 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping
+import codecs
+from datetime import datetime
+from functools import lru_cache
+import json
 import logging
+import re
+import time
 from typing import Any
+from urllib.parse import urlencode
+import zlib
 
+from aiohttp import ClientError, ClientResponse
 from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
+from homeassistant.util.json import json_loads
+from yarl import URL
 
-from .const import API_BASE_URL, API_TIMEOUT
+from .cache import ResponseCache
+from .discovery import TeamSnapDiscovery
+from .const import (
+    API_BASE_URL,
+    API_TIMEOUT,
+    CONSUMED_FIELDS,
+    DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_FETCH_PROFILE,
+    DEFAULT_OFFLOAD_THRESHOLD,
+    DEFAULT_PAGE_SIZE,
+    FETCH_PROFILE_MINIMAL,
+    MAX_RETRIES,
+    MAX_SEARCH_EVENTS,
+    MAX_SEARCH_TEAMS,
+    MAX_URL_LENGTH,
+    PROFILE_PAGE_SIZES,
+    RETRY_STATUSES,
+)
+from .metrics import RefreshMetrics
+from .models import AvailabilitySummary, TeamSnapEvent
+from .ratelimit import (
+    CircuitBreaker,
+    TokenBucket,
+    endpoint_key,
+    remaining_budget,
+    retry_delay,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Size of the body chunks handed to the streaming decoder
+CHUNK_SIZE = 16384
+
+# Encodings this client decompresses itself; sent instead of the session's
+# default, which may also offer ones it cannot (such as br)
+_ACCEPT_ENCODING = "gzip, deflate"
+
+_ITEM_SEPARATORS = frozenset(" \t\r\n,")
+# Matches the tail of the envelope just before a collection section opens
+_SECTION_KEY = re.compile(r'(?<!\\)"(\w+)"\s*:\s*$')
+# Collection sections kept in the envelope; others (queries, template) are
+# skipped while scanning and decode as null
+_KEPT_SECTIONS = frozenset({"links"})
+
 
 class TeamSnapAPIError(Exception):
     """Base exception for TeamSnap API errors."""
@@ -23,9 +75,200 @@ class TeamSnapAPIClient:
     def __init__(
         self,
         session: OAuth2Session,
+        cache: ResponseCache | None = None,
+        rate_limiter: TokenBucket | None = None,
+        breakers: dict[str, CircuitBreaker] | None = None,
+        discovery: TeamSnapDiscovery | None = None,
+        metrics: RefreshMetrics | None = None,
+        offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD * 1024,
+        fetch_profile: str = DEFAULT_FETCH_PROFILE,
+        cache_scope: str | None = None,
     ) -> None:
         """Initialize the TeamSnap API client."""
         self._session = session
+        self._cache = cache if cache is not None else ResponseCache()
+        # Prefixes the cache keys of account-scoped resources, so clients
+        # sharing a cache never revalidate each other's /me or /teams
+        self._cache_scope = cache_scope
+        self._rate_limiter = rate_limiter or TokenBucket()
+        self._breakers: dict[str, CircuitBreaker] = (
+            breakers if breakers is not None else {}
+        )
+        self._discovery = discovery or TeamSnapDiscovery()
+        self._metrics = metrics or RefreshMetrics()
+        # Bodies of at least this many bytes are decoded in the executor
+        self.offload_threshold = offload_threshold
+        # "minimal" asks for sparse items in larger pages
+        self.fetch_profile = fetch_profile
+        # Largest page size found to be honoured, by endpoint path
+        self._page_caps: dict[str, int] = {}
+
+    @property
+    def cache(self) -> ResponseCache:
+        """Return the conditional-request response cache."""
+        return self._cache
+
+    @property
+    def circuit_states(self) -> dict[str, str]:
+        """Return the circuit breaker state of every endpoint used so far."""
+        return {path: breaker.state for path, breaker in self._breakers.items()}
+
+    @property
+    def metrics(self) -> RefreshMetrics:
+        """Return the request and refresh statistics of this client."""
+        return self._metrics
+
+    @property
+    def discovery(self) -> TeamSnapDiscovery:
+        """Return the endpoint discovery used by this client."""
+        return self._discovery
+
+    async def _async_endpoint(self, rel: str) -> str:
+        """Return the endpoint for a rel, discovering the API root if due."""
+        await self._discovery.async_ensure(self._async_get_root)
+        return self._discovery.endpoint(rel)
+
+    async def _async_get_root(self) -> dict[str, Any]:
+        """Get the API root document."""
+        return await self._request("GET", "/")
+
+    def _url(self, endpoint: str) -> str:
+        """Return the absolute URL for an endpoint or followed link."""
+        if endpoint.startswith(("http://", "https://")):
+            return endpoint
+        return f"{API_BASE_URL}/{endpoint.lstrip('/')}"
+
+    def _account_key(self, key: str) -> str:
+        """Return a cache key scoped to this client's account."""
+        return f"{self._cache_scope}|{key}" if self._cache_scope else key
+
+    def _endpoint_key(self, endpoint: str) -> str:
+        """Return the id-free path an endpoint's statistics are kept under."""
+        return _path_key(self._url(endpoint))
+
+    def _fetch_options(
+        self, rel: str
+    ) -> tuple[int, frozenset[str] | None, dict[str, Any]]:
+        """Return the page size, kept fields and extra query of a collection.
+
+        The full profile fetches default pages of whole items. The minimal
+        one asks for larger pages and trims items to the fields in use,
+        asking the server for only those when discovery lists a ``fields``
+        parameter.
+        """
+        if self.fetch_profile != FETCH_PROFILE_MINIMAL:
+            return DEFAULT_PAGE_SIZE, None, {}
+        page_size = PROFILE_PAGE_SIZES.get(rel, DEFAULT_PAGE_SIZE)
+        fields = CONSUMED_FIELDS.get(rel)
+        if not fields:
+            return page_size, None, {}
+        params: dict[str, Any] = {}
+        if self._discovery.advertises(rel, "fields"):
+            params["fields"] = ",".join(fields)
+        return page_size, frozenset(fields), params
+
+    async def _async_send(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> ClientResponse:
+        """Send a request and raise for error statuses.
+
+        Requests are paced by the rate limiter and refused while the
+        endpoint's circuit is open. Throttling (429), server errors and
+        connection failures are retried with backoff, honouring Retry-After,
+        for as long as the current refresh's time budget allows.
+        """
+        url = self._url(endpoint)
+        path = self._endpoint_key(endpoint)
+        breaker = self._breakers.setdefault(path, CircuitBreaker())
+        attempt = 0
+        # Bodies are decompressed here rather than by aiohttp, so both the
+        # transferred and the decoded size are known
+        kwargs["headers"] = {
+            "Accept-Encoding": _ACCEPT_ENCODING,
+            **(kwargs.get("headers") or {}),
+        }
+        kwargs["auto_decompress"] = False
+
+        while True:
+            if not breaker.allow():
+                raise TeamSnapAPIError(
+                    f"TeamSnap API unavailable for {path}, not retrying yet"
+                )
+            remaining = remaining_budget()
+            if remaining is not None and remaining <= 0:
+                raise TeamSnapAPIError("Refresh time budget exhausted")
+
+            await self._rate_limiter.acquire()
+            timeout = API_TIMEOUT if remaining is None else min(API_TIMEOUT, remaining)
+            start = time.perf_counter()
+            try:
+                response = await self._session.async_request(
+                    method,
+                    url,
+                    timeout=timeout,
+                    **kwargs,
+                )
+            except (asyncio.TimeoutError, ClientError) as err:
+                self._metrics.record_response(
+                    path,
+                    "timeout" if isinstance(err, asyncio.TimeoutError) else "error",
+                    time.perf_counter() - start,
+                )
+                breaker.record_failure()
+                delay = retry_delay(attempt)
+                if not _can_retry(method, attempt, delay):
+                    if isinstance(err, asyncio.TimeoutError):
+                        raise
+                    raise TeamSnapAPIError(
+                        f"Error communicating with TeamSnap API: {err}"
+                    ) from err
+                reason = repr(err)
+            else:
+                self._metrics.record_response(
+                    path, response.status, time.perf_counter() - start
+                )
+                if response.status not in RETRY_STATUSES:
+                    breaker.record_success()
+                    break
+                # 429 means throttled rather than down, so it does not count
+                # against the circuit
+                if response.status != 429:
+                    breaker.record_failure()
+                delay = retry_delay(attempt, response.headers.get("Retry-After"))
+                if not _can_retry(method, attempt, delay):
+                    break
+                response.release()
+                reason = f"status {response.status}"
+
+            _LOGGER.debug(
+                "Retrying %s in %.1fs after %s (attempt %d)",
+                path,
+                delay,
+                reason,
+                attempt + 1,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        if response.status == 401:
+            _LOGGER.warning("Unauthorized - token may need refresh")
+            raise TeamSnapAPIError("Authentication failed - token may be expired")
+
+        if response.status >= 400:
+            try:
+                body = _inflate(
+                    _decompressor(response), await response.read(), final=True
+                ).decode("utf-8", "replace")
+            except Exception:
+                body = "Unable to read error response"
+            raise TeamSnapAPIError(
+                f"API request failed ({response.status}): {body}"
+            )
+
+        return response
 
     async def _request(
         self,
@@ -34,69 +277,765 @@ class TeamSnapAPIClient:
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Make a request to the TeamSnap API."""
-        url = f"{API_BASE_URL}/{endpoint.lstrip('/')}"
+        key = self._account_key(_cache_key(self._url(endpoint), kwargs.get("params")))
+        cached = self._cache.get(key) if method == "GET" else None
+        if cached is not None:
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                **cached.conditional_headers,
+            }
 
         try:
-            response = await self._session.async_request(
-                method,
-                url,
-                timeout=API_TIMEOUT,
-                **kwargs,
-            )
-
-            if response.status == 401:
-                _LOGGER.warning("Unauthorized - token may need refresh")
-                raise TeamSnapAPIError("Authentication failed - token may be expired")
+            response = await self._async_send(method, endpoint, **kwargs)
 
-            if response.status >= 400:
-                try:
-                    body = await response.text()
-                except Exception:
-                    body = "Unable to read error response"
-                raise TeamSnapAPIError(
-                    f"API request failed ({response.status}): {body}"
-                )
+            if response.status == 304 and cached is not None:
+                response.release()
+                self._cache.hit(cached)
+                return cached.body
 
+            start = time.perf_counter()
+            body = wire_body = await response.read()
+            read = time.perf_counter() - start
+            offload = False
             try:
-                data = await response.json()
-            except Exception:
+                body = _inflate(_decompressor(response), wire_body, final=True)
+                offload = len(body) >= self.offload_threshold
+                if offload:
+                    data = await asyncio.get_running_loop().run_in_executor(
+                        None, json_loads, body
+                    )
+                else:
+                    data = json_loads(body)
+            except ValueError:
                 _LOGGER.warning("Response was not JSON, returning empty dict")
                 return {}
+            finally:
+                decode = time.perf_counter() - start - read
+                self._metrics.record_body(
+                    self._endpoint_key(endpoint),
+                    len(body),
+                    read,
+                    0.0 if offload else decode,
+                    decode if offload else 0.0,
+                    len(wire_body),
+                )
 
+            if method == "GET":
+                self._cache.put(
+                    key,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    data,
+                )
             return data
 
         except asyncio.TimeoutError as err:
             _LOGGER.error("Timeout communicating with TeamSnap API: %s", err)
             raise TeamSnapAPIError(f"API request timed out: {err}") from err
+        except ClientError as err:
+            # Raised while reading the body, after the status was checked
+            raise TeamSnapAPIError(
+                f"Error reading TeamSnap API response: {err}"
+            ) from err
 
     async def async_get_user(self) -> dict[str, Any]:
         """Get the authenticated user's information."""
-        return await self._request("GET", "/me")
+        return await self._request("GET", await self._async_endpoint("me"))
+
+    async def _async_iter_collection(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        transform: Callable[[dict[str, Any]], Any] | None = None,
+        fields: frozenset[str] | None = None,
+        cacheable: bool = True,
+        shared: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Yield every item of a Collection+JSON resource, following pages.
+
+        Items are decoded from the response body as it streams in, so only
+        one chunk and the items it completes are held at a time. Once the
+        decoded body reaches ``offload_threshold`` bytes, the rest is read
+        whole and decoded, flattened and transformed in the executor, so a
+        large page does not stall the event loop; uncompressed bodies
+        announced as that large go there from the start. Pages served with
+        validators are kept in the response cache after ``transform`` has
+        been applied, and a 304 replays those same items. Queries that never
+        repeat, such as delta syncs, pass ``cacheable=False`` so they do not
+        evict pages that can be revalidated. Pages are cached under this
+        client's account unless ``shared``, which only team-scoped queries
+        pass. Only ``fields`` are kept of each item, when given.
+
+        A first page shorter than a large ``page_size`` but no shorter than
+        the default may have been capped by the server, so the next page at
+        that size is fetched once per endpoint; the outcome is remembered.
+        """
+        path = self._endpoint_key(endpoint)
+        page_size = min(page_size, self._page_caps.get(path, page_size))
+        params = {**(params or {}), "page_size": page_size, "page_number": 1}
+        probing = False
+
+        while True:
+            key = _cache_key(self._url(endpoint), params)
+            if fields is not None:
+                # Trimmed pages are cached apart from whole ones
+                key += "#" + ",".join(sorted(fields))
+            if not shared:
+                key = self._account_key(key)
+            cached = self._cache.get(key) if cacheable else None
+            headers = cached.conditional_headers if cached else {}
+            count = 0
+            try:
+                response = await self._async_send(
+                    "GET", endpoint, params=params, headers=headers
+                )
+                try:
+                    if response.status == 304 and cached is not None:
+                        self._cache.hit(cached)
+                        next_href = cached.next_href
+                        for item in cached.body:
+                            count += 1
+                            yield item
+                    else:
+                        etag = response.headers.get("ETag")
+                        last_modified = response.headers.get("Last-Modified")
+                        # Only keep the page if it can be revalidated later
+                        page: list[Any] | None = (
+                            [] if cacheable and (etag or last_modified) else None
+                        )
+                        decompressor = _decompressor(response)
+                        length = response.content_length
+                        if (
+                            decompressor is None
+                            and length is not None
+                            and length >= self.offload_threshold
+                        ):
+                            items, next_href = await self._async_decode_off_loop(
+                                endpoint, response, transform, fields
+                            )
+                            for item in items:
+                                if page is not None:
+                                    page.append(item)
+                                count += 1
+                                yield item
+                        else:
+                            decoder = CollectionDecoder(fields)
+                            size = wire = 0
+                            read = decode = 0.0
+                            pending = b""
+                            # Time spent in the consumer between items is not
+                            # counted; the clock restarts after every chunk
+                            mark = time.perf_counter()
+                            async for chunk in response.content.iter_chunked(
+                                CHUNK_SIZE
+                            ):
+                                start = time.perf_counter()
+                                read += start - mark
+                                wire += len(chunk)
+                                chunk = _inflate(decompressor, chunk)
+                                size += len(chunk)
+                                if size >= self.offload_threshold:
+                                    # Left with the rest for the executor
+                                    pending = chunk
+                                    break
+                                items = _decode(decoder.feed(chunk), transform)
+                                decode += time.perf_counter() - start
+                                for item in items:
+                                    if page is not None:
+                                        page.append(item)
+                                    count += 1
+                                    yield item
+                                mark = time.perf_counter()
+
+                            # Whatever is left of a large body is decoded
+                            # off the loop; otherwise this is already empty
+                            start = time.perf_counter()
+                            rest = await response.content.read()
+                            read += time.perf_counter() - start
+                            wire += len(rest)
+                            offload = size >= self.offload_threshold
+                            size -= len(pending)
+                            start = time.perf_counter()
+                            if offload:
+                                items, rest_size = await (
+                                    asyncio.get_running_loop().run_in_executor(
+                                        None,
+                                        _finish_decode,
+                                        decoder,
+                                        decompressor,
+                                        pending,
+                                        rest,
+                                        transform,
+                                    )
+                                )
+                            else:
+                                items, rest_size = _finish_decode(
+                                    decoder, decompressor, pending, rest, transform
+                                )
+                            elapsed = time.perf_counter() - start
+                            self._metrics.record_body(
+                                path,
+                                size + rest_size,
+                                read,
+                                decode + (0.0 if offload else elapsed),
+                                elapsed if offload else 0.0,
+                                wire,
+                            )
+                            for item in items:
+                                if page is not None:
+                                    page.append(item)
+                                count += 1
+                                yield item
+                            next_href = decoder.next_href
+                        if cacheable:
+                            self._cache.put(
+                                key, etag, last_modified, page, next_href
+                            )
+                finally:
+                    response.release()
+            except asyncio.TimeoutError as err:
+                _LOGGER.error("Timeout communicating with TeamSnap API: %s", err)
+                raise TeamSnapAPIError(f"API request timed out: {err}") from err
+            except ClientError as err:
+                # A connection dropped mid-body must fail like any other
+                # request, so callers can isolate the team it was for
+                raise TeamSnapAPIError(
+                    f"Error reading TeamSnap API response: {err}"
+                ) from err
+
+            if probing:
+                probing = False
+                if count:
+                    _LOGGER.debug(
+                        "%s caps pages at %d items", path, params["page_size"]
+                    )
+                    self._page_caps[path] = params["page_size"]
+                else:
+                    self._page_caps[path] = page_size
+            if next_href:
+                # Next link already carries the query string
+                endpoint, params = next_href, None
+            elif params is None:
+                return
+            elif count >= params["page_size"]:
+                params = {**params, "page_number": params["page_number"] + 1}
+            elif (
+                params["page_number"] == 1
+                and count >= DEFAULT_PAGE_SIZE
+                and path not in self._page_caps
+            ):
+                # Same offset as page 2 if the server capped the page at count
+                probing = True
+                params = {**params, "page_size": count, "page_number": 2}
+            else:
+                return
+
+    async def _async_decode_off_loop(
+        self,
+        endpoint: str,
+        response: ClientResponse,
+        transform: Callable[[dict[str, Any]], Any] | None,
+        fields: frozenset[str] | None,
+    ) -> tuple[list[Any], str | None]:
+        """Read a whole body and decode it in the executor."""
+        start = time.perf_counter()
+        body = await response.read()
+        read = time.perf_counter() - start
+        start = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, _decode_document, body, transform, fields
+            )
+        finally:
+            self._metrics.record_body(
+                self._endpoint_key(endpoint),
+                len(body),
+                read,
+                0.0,
+                time.perf_counter() - start,
+            )
 
     async def async_get_teams(self) -> list[dict[str, Any]]:
         """Get all teams for the authenticated user."""
-        data = await self._request("GET", "/teams")
-        # TeamSnap API returns data in a collection format
-        if isinstance(data, dict) and "collection" in data:
-            return data["collection"]
-        if isinstance(data, list):
-            return data
-        return []
+        endpoint = await self._async_endpoint("teams")
+        page_size, fields, params = self._fetch_options("teams")
+        return [
+            team
+            async for team in self._async_iter_collection(
+                endpoint, params, page_size, fields=fields
+            )
+        ]
+
+    async def async_iter_team_events(
+        self,
+        team_id: int | str,
+        started_after: datetime | None = None,
+        started_before: datetime | None = None,
+        updated_since: datetime | None = None,
+    ) -> AsyncIterator[TeamSnapEvent]:
+        """Yield events for a specific team as they are decoded."""
+        params = _event_filters(started_after, started_before, updated_since)
+        team = int(team_id)
+
+        def _to_event(item: dict[str, Any]) -> TeamSnapEvent:
+            return TeamSnapEvent.from_api(item, team)
+
+        endpoint = (await self._async_endpoint("team_events")).format(
+            team_id=team_id
+        )
+        page_size, fields, extra = self._fetch_options("team_events")
+        async for event in self._async_iter_collection(
+            endpoint,
+            {**params, **extra},
+            page_size,
+            _to_event,
+            fields,
+            # Delta queries carry a new timestamp every time
+            cacheable=updated_since is None,
+            shared=True,
+        ):
+            yield event
 
     async def async_get_team_events(
-        self, team_id: int | str
-    ) -> list[dict[str, Any]]:
-        """Get all events for a specific team."""
-        data = await self._request("GET", f"/teams/{team_id}/events")
-        # TeamSnap API returns data in a collection format
-        if isinstance(data, dict) and "collection" in data:
-            return data["collection"]
-        if isinstance(data, list):
-            return data
-        return []
+        self,
+        team_id: int | str,
+        started_after: datetime | None = None,
+        started_before: datetime | None = None,
+        updated_since: datetime | None = None,
+    ) -> list[TeamSnapEvent]:
+        """Get events for a specific team, optionally filtered."""
+        return [
+            event
+            async for event in self.async_iter_team_events(
+                team_id, started_after, started_before, updated_since
+            )
+        ]
+
+    async def async_search_events(
+        self,
+        team_ids: Iterable[int],
+        started_after: datetime | None = None,
+        started_before: datetime | None = None,
+        updated_since: datetime | None = None,
+        concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+    ) -> dict[int, list[TeamSnapEvent]]:
+        """Search events for many teams at once, bucketed by team.
+
+        Team ids are sent as comma-separated ``team_id`` lists, split into
+        chunks that stay under the URL length and team count limits. Every
+        team of a chunk that succeeded gets a bucket, even an empty one;
+        teams of a chunk that failed are left out so callers can retry them
+        one by one.
+        """
+        endpoint = await self._async_endpoint("events_search")
+        if not self._discovery.supports("events_search", "team_id"):
+            # Callers fall back to per-team fetches for teams left out
+            _LOGGER.debug("Event search does not take team_id lists")
+            return {}
+        page_size, fields, extra = self._fetch_options("events_search")
+        params = {
+            **_event_filters(started_after, started_before, updated_since),
+            **extra,
+        }
+        url = self._url(endpoint)
+        # Room left for the team_id list once everything else is in the URL
+        budget = MAX_URL_LENGTH - len(
+            _cache_key(url, {**params, "page_size": 0, "page_number": 0})
+        )
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _search(chunk: list[int]) -> dict[int, list[TeamSnapEvent]]:
+            buckets: dict[int, list[TeamSnapEvent]] = {team: [] for team in chunk}
+
+            def _to_event(item: dict[str, Any]) -> TeamSnapEvent:
+                # Search results carry team_id; the fallback only matters
+                # for single-team chunks
+                return TeamSnapEvent.from_api(item, chunk[0])
+
+            async with semaphore:
+                try:
+                    async for event in self._async_iter_collection(
+                        endpoint,
+                        {**params, "team_id": ",".join(map(str, chunk))},
+                        page_size,
+                        _to_event,
+                        fields,
+                        cacheable=updated_since is None,
+                        shared=True,
+                    ):
+                        if event.team_id in buckets:
+                            buckets[event.team_id].append(event)
+                except TeamSnapAPIError as err:
+                    _LOGGER.warning(
+                        "Event search failed for teams %s: %s", chunk, err
+                    )
+                    return {}
+            return buckets
+
+        results = await asyncio.gather(
+            *(_search(chunk) for chunk in _chunk_ids(team_ids, budget))
+        )
+        events_by_team: dict[int, list[TeamSnapEvent]] = {}
+        for buckets in results:
+            events_by_team.update(buckets)
+        return events_by_team
+
+    async def async_get_availability(
+        self,
+        event_teams: Mapping[int, int],
+        concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+    ) -> dict[int, AvailabilitySummary]:
+        """Count member availability for many events at once.
+
+        ``event_teams`` maps event ids to their team ids. Event ids are sent
+        as comma-separated ``event_id`` lists to the availability search,
+        instead of one request per event. Chunks never mix teams and hold
+        sorted ids, so an event of one team changing leaves the URLs, and
+        cached validators, of every other team's chunks alone. Events of a
+        chunk that failed are left out; events nobody answered for get an
+        empty summary.
+        """
+        endpoint = await self._async_endpoint("availabilities_search")
+        if not self._discovery.supports("availabilities_search", "event_id"):
+            _LOGGER.debug("Availability search does not take event_id lists")
+            return {}
+        page_size, fields, params = self._fetch_options("availabilities_search")
+        url = self._url(endpoint)
+        budget = MAX_URL_LENGTH - len(
+            _cache_key(url, {**params, "page_size": 0, "page_number": 0})
+        )
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        def _to_status(item: dict[str, Any]) -> tuple[Any, Any]:
+            return item.get("event_id"), item.get("status_code")
+
+        async def _search(chunk: list[int]) -> dict[int, list[int | None]]:
+            codes: dict[int, list[int | None]] = {event_id: [] for event_id in chunk}
+            async with semaphore:
+                try:
+                    async for event_id, status in self._async_iter_collection(
+                        endpoint,
+                        {**params, "event_id": ",".join(map(str, chunk))},
+                        page_size,
+                        _to_status,
+                        fields,
+                        shared=True,
+                    ):
+                        if event_id in codes:
+                            codes[event_id].append(status)
+                except TeamSnapAPIError as err:
+                    _LOGGER.warning(
+                        "Availability search failed for events %s: %s", chunk, err
+                    )
+                    return {}
+            return codes
+
+        by_team: dict[int, list[int]] = {}
+        for event_id, team_id in event_teams.items():
+            by_team.setdefault(team_id, []).append(event_id)
+        results = await asyncio.gather(
+            *(
+                _search(chunk)
+                for team_id in sorted(by_team)
+                for chunk in _chunk_ids(
+                    sorted(by_team[team_id]), budget, "event_id", MAX_SEARCH_EVENTS
+                )
+            )
+        )
+        return {
+            event_id: AvailabilitySummary.from_status_codes(codes)
+            for chunk_codes in results
+            for event_id, codes in chunk_codes.items()
+        }
 
     async def async_get_event(
         self, event_id: int | str
     ) -> dict[str, Any]:
         """Get details for a specific event."""
-        return await self._request("GET", f"/events/{event_id}")
+        events = await self._async_endpoint("events")
+        return await self._request("GET", f"{events.rstrip('/')}/{event_id}")
+
+
+class CollectionDecoder:
+    """Incremental Collection+JSON decoder.
+
+    Bytes are fed in as they arrive. Entries of ``collection.items`` are
+    decoded and flattened into field maps as soon as each one is complete.
+    Of the rest of the document only ``links`` and scalar members such as
+    ``href`` are kept, as a small envelope parsed when the body ends;
+    sections like ``queries`` and ``template`` are scanned past without
+    being buffered. Given ``fields``, each item keeps only those, dropping
+    its links and unused data as it is decoded.
+    """
+
+    def __init__(self, fields: frozenset[str] | None = None) -> None:
+        """Initialize the decoder."""
+        self._fields = fields
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._envelope = ""
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._in_items = False
+        self._skipping = False
+        # Plain lists have no sections to pick out
+        self._root = ""
+        self.envelope: dict[str, Any] | list[Any] | None = None
+        self.next_href: str | None = None
+
+    def feed(self, chunk: bytes) -> list[dict[str, Any]]:
+        """Consume a chunk of the body and return the items it completed."""
+        self._buffer += self._text.decode(chunk)
+        return self._drain()
+
+    def close(self) -> list[dict[str, Any]]:
+        """Finish decoding and return any remaining items."""
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._drain()
+        if self._in_items or self._buffer.strip():
+            raise TeamSnapAPIError("Truncated Collection+JSON response")
+        if not self._envelope.strip():
+            self.envelope = {}
+            return items
+
+        try:
+            self.envelope = json.loads(self._envelope)
+        except ValueError as err:
+            raise TeamSnapAPIError(f"Invalid Collection+JSON response: {err}") from err
+
+        # Plain lists are passed through as-is
+        if isinstance(self.envelope, list):
+            return items + self.envelope
+        self.next_href = _next_href(self.envelope.get("collection") or {})
+        return items
+
+    def _drain(self) -> list[dict[str, Any]]:
+        """Decode as much of the buffer as is complete."""
+        items: list[dict[str, Any]] = []
+        buffer = self._buffer
+        end = len(buffer)
+        pos = 0
+
+        while pos < end:
+            if self._in_items:
+                while pos < end and buffer[pos] in _ITEM_SEPARATORS:
+                    pos += 1
+                if pos == end:
+                    break
+                if buffer[pos] == "]":
+                    self._in_items = False
+                    self._envelope += "]"
+                    pos += 1
+                    continue
+                try:
+                    item, pos = self._json.raw_decode(buffer, pos)
+                except ValueError:
+                    # Item is not complete yet
+                    break
+                items.append(_flatten_item(item, self._fields))
+                continue
+
+            # Envelope text is small, so it is scanned a character at a time
+            start = pos
+            while pos < end:
+                char = buffer[pos]
+                pos += 1
+                if self._in_string:
+                    if self._escape:
+                        self._escape = False
+                    elif char == "\\":
+                        self._escape = True
+                    elif char == '"':
+                        self._in_string = False
+                elif char == '"':
+                    self._in_string = True
+                elif char == "{" or char == "[":
+                    if self._depth == 0:
+                        self._root = char
+                    elif (
+                        self._depth == 2 and self._root == "{" and not self._skipping
+                    ):
+                        key = _SECTION_KEY.search(
+                            self._envelope[-32:] + buffer[start : pos - 1]
+                        )
+                        section = key.group(1) if key else None
+                        if char == "[" and section == "items":
+                            self._envelope += buffer[start:pos]
+                            self._in_items = True
+                            start = pos
+                            break
+                        if section not in _KEPT_SECTIONS:
+                            self._envelope += buffer[start : pos - 1] + "null"
+                            self._skipping = True
+                    self._depth += 1
+                elif char == "}" or char == "]":
+                    self._depth -= 1
+                    if self._skipping and self._depth == 2:
+                        self._skipping = False
+                        start = pos
+            if not self._skipping:
+                self._envelope += buffer[start:pos]
+
+        self._buffer = buffer[pos:]
+        return items
+
+
+def _can_retry(method: str, attempt: int, delay: float) -> bool:
+    """Return whether a failed request may be retried after a delay."""
+    if method != "GET" or attempt >= MAX_RETRIES:
+        return False
+    remaining = remaining_budget()
+    return remaining is None or delay < remaining
+
+
+def _event_filters(
+    started_after: datetime | None,
+    started_before: datetime | None,
+    updated_since: datetime | None,
+) -> dict[str, Any]:
+    """Return the query parameters for the given event filters."""
+    params: dict[str, Any] = {}
+    if started_after is not None:
+        params["started_after"] = started_after.isoformat()
+    if started_before is not None:
+        params["started_before"] = started_before.isoformat()
+    if updated_since is not None:
+        params["updated_since"] = updated_since.isoformat()
+    return params
+
+
+def _chunk_ids(
+    ids: Iterable[int],
+    budget: int,
+    param: str = "team_id",
+    max_ids: int = MAX_SEARCH_TEAMS,
+) -> Iterator[list[int]]:
+    """Split ids into chunks whose comma-separated form fits the budget."""
+    chunk: list[int] = []
+    overhead = len(f"&{param}=")
+    used = overhead
+    for value in ids:
+        # Commas are sent percent-encoded
+        cost = len(str(value)) + (3 if chunk else 0)
+        if chunk and (used + cost > budget or len(chunk) >= max_ids):
+            yield chunk
+            chunk, used, cost = [], overhead, len(str(value))
+        chunk.append(value)
+        used += cost
+    if chunk:
+        yield chunk
+
+
+def _cache_key(url: str, params: dict[str, Any] | None) -> str:
+    """Return the response cache key for a URL and its query parameters."""
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+@lru_cache(maxsize=256)
+def _path_key(url: str) -> str:
+    """Return the id-free path of a URL; parsing is slow enough to memoize."""
+    return endpoint_key(URL(url).path)
+
+
+def _decode_document(
+    body: bytes,
+    transform: Callable[[dict[str, Any]], Any] | None,
+    fields: frozenset[str] | None = None,
+) -> tuple[list[Any], str | None]:
+    """Decode a whole Collection+JSON body into items and the next page link.
+
+    Runs in the executor; produces what ``CollectionDecoder`` would.
+    """
+    try:
+        document = json_loads(body) if body.strip() else {}
+    except ValueError as err:
+        raise TeamSnapAPIError(f"Invalid Collection+JSON response: {err}") from err
+    # Plain lists are passed through as-is
+    if isinstance(document, list):
+        return _decode(document, transform), None
+    collection = document.get("collection") or {}
+    items = [
+        _flatten_item(item, fields) for item in collection.get("items") or []
+    ]
+    return _decode(items, transform), _next_href(collection)
+
+
+def _finish_decode(
+    decoder: CollectionDecoder,
+    decompressor: Any | None,
+    pending: bytes,
+    rest: bytes,
+    transform: Callable[[dict[str, Any]], Any] | None,
+) -> tuple[list[Any], int]:
+    """Decode the rest of a streamed body and return its items and size.
+
+    ``pending`` is already decompressed, ``rest`` is as received. May run in
+    the executor once the event loop has handed the decoder over.
+    """
+    body = pending + _inflate(decompressor, rest, final=True)
+    items = decoder.feed(body) if body else []
+    return _decode(items + decoder.close(), transform), len(body)
+
+
+def _decompressor(response: ClientResponse) -> Any | None:
+    """Return a decompressor for a response's Content-Encoding, if any."""
+    encoding = response.headers.get("Content-Encoding", "").strip().lower()
+    if encoding in ("", "identity"):
+        return None
+    if encoding in ("gzip", "x-gzip", "deflate"):
+        # Accepts both gzip and zlib headers
+        return zlib.decompressobj(wbits=zlib.MAX_WBITS | 32)
+    raise TeamSnapAPIError(f"Unsupported Content-Encoding: {encoding}")
+
+
+def _inflate(decompressor: Any | None, data: bytes, final: bool = False) -> bytes:
+    """Decompress part of a body, or all that is left of it when final."""
+    if decompressor is None:
+        return data
+    try:
+        data = decompressor.decompress(data)
+        return data + decompressor.flush() if final else data
+    except zlib.error as err:
+        raise TeamSnapAPIError(f"Invalid compressed response: {err}") from err
+
+
+def _next_href(collection: dict[str, Any]) -> str | None:
+    """Return the next page link of a collection, if there is one."""
+    return next(
+        (
+            link.get("href")
+            for link in collection.get("links", [])
+            if link.get("rel") == "next"
+        ),
+        None,
+    )
+
+
+def _decode(
+    items: list[dict[str, Any]],
+    transform: Callable[[dict[str, Any]], Any] | None,
+) -> list[Any]:
+    """Apply a collection's item transform to freshly decoded items."""
+    if transform is None:
+        return items
+    return [transform(item) for item in items]
+
+
+def _flatten_item(
+    item: Any, fields: frozenset[str] | None = None
+) -> dict[str, Any]:
+    """Flatten a Collection+JSON item's name/value pairs into a field map."""
+    if isinstance(item, dict) and isinstance(item.get("data"), list):
+        if fields is None:
+            return {field["name"]: field.get("value") for field in item["data"]}
+        return {
+            field["name"]: field.get("value")
+            for field in item["data"]
+            if field["name"] in fields
+        }
+    return item
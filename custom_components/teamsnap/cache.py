@@ -0,0 +1,103 @@
+"""Conditional-request response cache for the TeamSnap API client."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import time
+from typing import Any
+
+from .const import DEFAULT_CACHE_MAX_AGE, DEFAULT_CACHE_MAX_ENTRIES
+
+
+class CachedResponse:
+    """A decoded response body with the validators it was served with."""
+
+    __slots__ = ("etag", "last_modified", "body", "next_href", "stored_at")
+
+    def __init__(
+        self,
+        etag: str | None,
+        last_modified: str | None,
+        body: Any,
+        next_href: str | None = None,
+    ) -> None:
+        """Initialize the cached response."""
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+        self.next_href = next_href
+        self.stored_at = time.monotonic()
+
+    @property
+    def conditional_headers(self) -> dict[str, str]:
+        """Return the headers that revalidate this response."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """LRU cache of decoded responses keyed by request URL.
+
+    Entries are evicted once the cache holds more than ``max_entries`` or
+    when they have not been revalidated for ``max_age`` seconds.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_age: float = DEFAULT_CACHE_MAX_AGE,
+    ) -> None:
+        """Initialize the cache."""
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._max_entries = max_entries
+        self._max_age = max_age
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the cached response for a key, if still fresh enough."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.stored_at > self._max_age:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def hit(self, entry: CachedResponse) -> None:
+        """Record that the server confirmed a cached response is current."""
+        entry.stored_at = time.monotonic()
+        self.hits += 1
+
+    def put(
+        self,
+        key: str,
+        etag: str | None,
+        last_modified: str | None,
+        body: Any,
+        next_href: str | None = None,
+    ) -> None:
+        """Store a response, if it carries validators, and record a miss."""
+        self.misses += 1
+        if not etag and not last_modified:
+            # Nothing to revalidate with, so nothing worth keeping
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = CachedResponse(etag, last_modified, body, next_href)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
@@ -0,0 +1,114 @@
+"""Calendar platform for TeamSnap integration."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import datetime
+import logging
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import CALENDAR_CACHE_SIZE, DOMAIN
+from .coordinator import TeamSnapDataUpdateCoordinator
+from .models import EventKind, TeamSnapEvent
+from .timeline import EventTimeline
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the TeamSnap calendar entity."""
+    coordinator: TeamSnapDataUpdateCoordinator | None = hass.data.get(
+        DOMAIN, {}
+    ).get(entry.entry_id)
+    if coordinator is None:
+        _LOGGER.error("TeamSnap coordinator not found for entry %s", entry.entry_id)
+        return
+
+    async_add_entities([TeamSnapCalendar(coordinator)])
+
+
+class TeamSnapCalendar(
+    CoordinatorEntity[TeamSnapDataUpdateCoordinator], CalendarEntity
+):
+    """Calendar of every team's TeamSnap events.
+
+    Range queries are answered from the coordinator's sorted timeline, and
+    the results of recent ranges are kept until the timeline is rebuilt.
+    """
+
+    _attr_icon = "mdi:calendar-account"
+
+    def __init__(self, coordinator: TeamSnapDataUpdateCoordinator) -> None:
+        """Initialize the calendar."""
+        super().__init__(coordinator)
+        entry_id = (
+            coordinator.config_entry.entry_id if coordinator.config_entry else "unknown"
+        )
+        self._attr_unique_id = f"{entry_id}_calendar"
+        self._attr_name = "TeamSnap Schedule"
+        self._ranges: OrderedDict[tuple[datetime, datetime], list[CalendarEvent]] = (
+            OrderedDict()
+        )
+        self._ranges_timeline: EventTimeline | None = None
+
+    @property
+    def available(self) -> bool:
+        """Return whether the calendar has fresh or restored events to show."""
+        return super().available or self.coordinator.serving_snapshot
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the event in progress, or the next upcoming one."""
+        event = self.coordinator.timeline.current_or_next(dt_util.utcnow())
+        return self._calendar_event(event) if event else None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return events overlapping a time range."""
+        timeline = self.coordinator.timeline
+        if timeline is not self._ranges_timeline:
+            # The timeline is only rebuilt when events changed
+            self._ranges.clear()
+            self._ranges_timeline = timeline
+
+        key = (start_date, end_date)
+        if (events := self._ranges.get(key)) is not None:
+            self._ranges.move_to_end(key)
+            return events
+
+        events = [
+            self._calendar_event(event)
+            for event in timeline.overlapping(
+                dt_util.as_utc(start_date), dt_util.as_utc(end_date)
+            )
+        ]
+        self._ranges[key] = events
+        if len(self._ranges) > CALENDAR_CACHE_SIZE:
+            self._ranges.popitem(last=False)
+        return events
+
+    def _calendar_event(self, event: TeamSnapEvent) -> CalendarEvent:
+        """Convert a TeamSnap event to a calendar event."""
+        team = self.coordinator.teams_by_id.get(event.team_id)
+        summary = event.name
+        if not summary and event.kind is EventKind.GAME and event.opponent:
+            summary = f"vs {event.opponent}"
+        return CalendarEvent(
+            start=dt_util.as_local(event.start),  # type: ignore[arg-type]
+            end=dt_util.as_local(event.end),  # type: ignore[arg-type]
+            summary=summary or event.kind.value.capitalize(),
+            description=team.get("name") if team else None,
+            location=event.location,
+            uid=str(event.id) if event.id is not None else None,
+        )
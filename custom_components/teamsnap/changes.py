@@ -0,0 +1,99 @@
+"""Change feed between successive TeamSnap event refreshes."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from .models import TeamSnapEvent
+
+CHANGE_ADDED = "added"
+CHANGE_REMOVED = "removed"
+CHANGE_RESCHEDULED = "rescheduled"
+CHANGE_LOCATION = "location_changed"
+CHANGE_UPDATED = "updated"
+
+
+class EventChange(NamedTuple):
+    """One change to one event between two refreshes."""
+
+    change: str
+    event: TeamSnapEvent
+    previous: TeamSnapEvent | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the change as bus event data."""
+        event = self.event
+        data: dict[str, Any] = {
+            "change": self.change,
+            "event_id": event.id,
+            "team_id": event.team_id,
+            "name": event.name,
+            "kind": event.kind.value,
+            "start": event.start.isoformat() if event.start else None,
+            "location": event.location,
+            "opponent": event.opponent,
+        }
+        if self.change == CHANGE_RESCHEDULED and self.previous is not None:
+            previous_start = self.previous.start
+            data["previous_start"] = (
+                previous_start.isoformat() if previous_start else None
+            )
+        elif self.change == CHANGE_LOCATION and self.previous is not None:
+            data["previous_location"] = self.previous.location
+        return data
+
+
+def diff_events(
+    previous: dict[int, list[TeamSnapEvent]],
+    current: dict[int, list[TeamSnapEvent]],
+    window: tuple[datetime, datetime],
+    previous_window_end: datetime | None = None,
+    horizons: dict[int, datetime] | None = None,
+    previous_horizons: dict[int, datetime] | None = None,
+) -> list[EventChange]:
+    """Return the changes between two sets of events grouped by team.
+
+    Only teams present in both sets whose event list is a new object are
+    compared, and events the sync kept as the same object are skipped
+    without hashing, so the work follows the changed events. Events that
+    merely scrolled into or out of the sync window, or past a team's
+    retention horizon, are not reported.
+    """
+    changes: list[EventChange] = []
+    horizons = horizons or {}
+    previous_horizons = previous_horizons or {}
+
+    for team_id, events in current.items():
+        old_events = previous.get(team_id)
+        if old_events is None or old_events is events:
+            continue
+        window_start, window_end = window[0], horizons.get(team_id, window[1])
+        added_end = previous_horizons.get(team_id, previous_window_end)
+
+        old_by_id = {event.id: event for event in old_events if event.id is not None}
+        for event in events:
+            if event.id is None:
+                continue
+            old = old_by_id.pop(event.id, None)
+            if old is None:
+                if added_end is None or event.start is None or event.start <= added_end:
+                    changes.append(EventChange(CHANGE_ADDED, event))
+            elif old is not event and old.content_hash != event.content_hash:
+                changes.append(_classify(old, event))
+
+        for old in old_by_id.values():
+            # Events pruned from the window were not cancelled
+            if old.start is None or window_start <= old.start <= window_end:
+                changes.append(EventChange(CHANGE_REMOVED, old))
+
+    return changes
+
+
+def _classify(old: TeamSnapEvent, event: TeamSnapEvent) -> EventChange:
+    """Name the most significant difference between two event versions."""
+    if old.start != event.start:
+        return EventChange(CHANGE_RESCHEDULED, event, old)
+    if old.location != event.location:
+        return EventChange(CHANGE_LOCATION, event, old)
+    return EventChange(CHANGE_UPDATED, event, old)
@@ -5,13 +5,36 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers import config_entry_oauth2_flow
+import voluptuous as vol
 
-from .const import DOMAIN
+from homeassistant.config_entries import ConfigEntry, OptionsFlow
+from homeassistant.core import callback
+from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import config_entry_oauth2_flow, selector
 
-_LOGGER = logging.getLogger(__name__)
+from .const import (
+    CONF_FETCH_CONCURRENCY,
+    CONF_FETCH_PROFILE,
+    CONF_MAX_EVENTS_PER_TEAM,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_OFFLOAD_THRESHOLD,
+    CONF_QUIET_HOURS_END,
+    CONF_QUIET_HOURS_START,
+    CONF_SYNC_FUTURE_DAYS,
+    CONF_SYNC_PAST_DAYS,
+    DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_FETCH_PROFILE,
+    DEFAULT_MAX_EVENTS_PER_TEAM,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DEFAULT_OFFLOAD_THRESHOLD,
+    DEFAULT_SYNC_FUTURE_DAYS,
+    DEFAULT_SYNC_PAST_DAYS,
+    DOMAIN,
+    FETCH_PROFILE_FULL,
+    FETCH_PROFILE_MINIMAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +46,12 @@ class TeamSnapConfigFlow(
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return TeamSnapOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle the initial step."""
         if self.source == "reauth":
@@ -39,4 +68,96 @@ class TeamSnapConfigFlow(
             return self.async_create_entry(title="TeamSnap", data=data)
         except Exception as err:
             _LOGGER.error("Failed to create OAuth entry: %s", err)
-            return self.async_abort(reason="oauth_error")
\ No newline at end of file
+            return self.async_abort(reason="oauth_error")
+
+
+class TeamSnapOptionsFlow(OptionsFlow):
+    """Handle TeamSnap options."""
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the polling and sync options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+
+        def _number(
+            minimum: int, maximum: int, unit: str | None = None
+        ) -> selector.NumberSelector:
+            config = selector.NumberSelectorConfig(
+                min=minimum, max=maximum, mode=selector.NumberSelectorMode.BOX
+            )
+            if unit:
+                config["unit_of_measurement"] = unit
+            return selector.NumberSelector(config)
+
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_MIN_UPDATE_INTERVAL,
+                    default=options.get(
+                        CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL
+                    ),
+                ): _number(60, 86400, "s"),
+                vol.Required(
+                    CONF_MAX_UPDATE_INTERVAL,
+                    default=options.get(
+                        CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+                    ),
+                ): _number(60, 86400, "s"),
+                vol.Optional(
+                    CONF_QUIET_HOURS_START,
+                    description={
+                        "suggested_value": options.get(CONF_QUIET_HOURS_START)
+                    },
+                ): selector.TimeSelector(),
+                vol.Optional(
+                    CONF_QUIET_HOURS_END,
+                    description={"suggested_value": options.get(CONF_QUIET_HOURS_END)},
+                ): selector.TimeSelector(),
+                vol.Required(
+                    CONF_FETCH_CONCURRENCY,
+                    default=options.get(
+                        CONF_FETCH_CONCURRENCY, DEFAULT_FETCH_CONCURRENCY
+                    ),
+                ): _number(1, 16),
+                vol.Required(
+                    CONF_SYNC_PAST_DAYS,
+                    default=options.get(CONF_SYNC_PAST_DAYS, DEFAULT_SYNC_PAST_DAYS),
+                ): _number(0, 365, "d"),
+                vol.Required(
+                    CONF_SYNC_FUTURE_DAYS,
+                    default=options.get(
+                        CONF_SYNC_FUTURE_DAYS, DEFAULT_SYNC_FUTURE_DAYS
+                    ),
+                ): _number(1, 730, "d"),
+                vol.Required(
+                    CONF_MAX_EVENTS_PER_TEAM,
+                    default=options.get(
+                        CONF_MAX_EVENTS_PER_TEAM, DEFAULT_MAX_EVENTS_PER_TEAM
+                    ),
+                ): _number(10, 5000),
+                vol.Required(
+                    CONF_OFFLOAD_THRESHOLD,
+                    default=options.get(
+                        CONF_OFFLOAD_THRESHOLD, DEFAULT_OFFLOAD_THRESHOLD
+                    ),
+                ): _number(0, 65536, "KB"),
+                vol.Required(
+                    CONF_FETCH_PROFILE,
+                    default=options.get(CONF_FETCH_PROFILE, DEFAULT_FETCH_PROFILE),
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=[FETCH_PROFILE_MINIMAL, FETCH_PROFILE_FULL],
+                        translation_key=CONF_FETCH_PROFILE,
+                    )
+                ),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
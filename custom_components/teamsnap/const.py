@@ -2,6 +2,9 @@
 
 DOMAIN = "teamsnap"
 
+# Key of the domain-wide registry in hass.data[DOMAIN]
+DATA_REGISTRY = "registry"
+
 # OAuth 2.0 Configuration
 OAUTH2_AUTHORIZE_URL = "https://auth.teamsnap.com/oauth/authorize"
 OAUTH2_TOKEN_URL = "https://auth.teamsnap.com/oauth/token"
@@ -10,9 +13,134 @@ OAUTH2_TOKEN_URL = "https://auth.teamsnap.com/oauth/token"
 API_BASE_URL = "https://api.teamsnap.com/v3"
 API_TIMEOUT = 30
 
+# Request pacing, retries and circuit breaking
+DEFAULT_RATE_LIMIT = 5.0  # requests per second
+DEFAULT_RATE_LIMIT_BURST = 10
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0  # seconds, doubled per attempt
+RETRY_MAX_DELAY = 30.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_BREAKER_THRESHOLD = 5  # consecutive failures
+DEFAULT_BREAKER_RESET_TIMEOUT = 120  # seconds
+# Total time one refresh may spend on requests, retries included
+DEFAULT_REFRESH_BUDGET = 120
+DEFAULT_PAGE_SIZE = 100
+
+# Limits for batched multi-team searches
+MAX_URL_LENGTH = 2000
+MAX_SEARCH_TEAMS = 25
+MAX_SEARCH_EVENTS = 50
+
+# How long the discovered API root is trusted, and the wait after a failure
+DISCOVERY_TTL = 86400  # 24 hours
+DISCOVERY_RETRY_INTERVAL = 3600  # 1 hour
+
+# Conditional-request response cache limits
+DEFAULT_CACHE_MAX_ENTRIES = 256
+DEFAULT_CACHE_MAX_AGE = 86400  # 24 hours
+
 # Default update interval (in seconds)
 DEFAULT_UPDATE_INTERVAL = 900  # 15 minutes
 
+# How long one entry's team events are reused by other entries (in seconds)
+SHARED_EVENTS_MAX_AGE = 120
+
+# How often the slow-changing team list is refetched (in seconds)
+DEFAULT_TEAMS_REFRESH_INTERVAL = 21600  # 6 hours
+
+# Adaptive polling bounds (in seconds) and quiet hours ("HH:MM")
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
+CONF_QUIET_HOURS_START = "quiet_hours_start"
+CONF_QUIET_HOURS_END = "quiet_hours_end"
+DEFAULT_MIN_UPDATE_INTERVAL = 300  # 5 minutes
+DEFAULT_MAX_UPDATE_INTERVAL = 14400  # 4 hours
+
+# Maximum number of team event fetches in flight at once (1 = sequential)
+CONF_FETCH_CONCURRENCY = "fetch_concurrency"
+DEFAULT_FETCH_CONCURRENCY = 4
+
+# Rolling event sync window (in days) and how often to re-download it in full
+CONF_SYNC_PAST_DAYS = "sync_past_days"
+CONF_SYNC_FUTURE_DAYS = "sync_future_days"
+DEFAULT_SYNC_PAST_DAYS = 7
+DEFAULT_SYNC_FUTURE_DAYS = 120
+DEFAULT_FULL_SYNC_INTERVAL = 21600  # 6 hours
+
+# How much of each resource is fetched: "full" representations, or only
+# the consumed fields in larger pages. Minimal is opt-in, so upgrading does
+# not change what existing installs fetch
+CONF_FETCH_PROFILE = "fetch_profile"
+FETCH_PROFILE_FULL = "full"
+FETCH_PROFILE_MINIMAL = "minimal"
+DEFAULT_FETCH_PROFILE = FETCH_PROFILE_FULL
+# Items per page under the minimal profile, by endpoint rel
+PROFILE_PAGE_SIZES = {
+    "events_search": 500,
+    "team_events": 500,
+    "availabilities_search": 1000,
+}
+# Fields read from each resource, by endpoint rel
+CONSUMED_FIELDS: dict[str, tuple[str, ...]] = {
+    "teams": ("id", "name"),
+    "events_search": (
+        "id",
+        "team_id",
+        "name",
+        "start_date",
+        "duration_in_minutes",
+        "is_game",
+        "event_type",
+        "location_name",
+        "opponent_name",
+    ),
+    "availabilities_search": ("event_id", "status_code"),
+}
+CONSUMED_FIELDS["team_events"] = CONSUMED_FIELDS["events_search"]
+
+# Responses at least this large (in KB) are decoded off the event loop
+CONF_OFFLOAD_THRESHOLD = "offload_threshold"
+DEFAULT_OFFLOAD_THRESHOLD = 128
+# Re-sorting at least this many events into the timeline is done off the loop
+OFFLOAD_MIN_EVENTS = 2000
+
+# Most events kept per team, upcoming ones first
+CONF_MAX_EVENTS_PER_TEAM = "max_events_per_team"
+DEFAULT_MAX_EVENTS_PER_TEAM = 500
+
+# How far ahead member availability is fetched for upcoming events
+AVAILABILITY_DAYS = 14
+
+# Length assumed for events without a duration, in minutes
+DEFAULT_EVENT_DURATION = 60
+
+# Calendar range queries remembered between data changes
+CALENDAR_CACHE_SIZE = 32
+
+# Completed refreshes kept for diagnostics
+METRICS_HISTORY = 50
+
+# Persistent snapshot storage
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60  # seconds
+
+# Services
+SERVICE_REFRESH = "refresh"
+SERVICE_PROFILE_REFRESH = "profile_refresh"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_DATE = "date"
+ATTR_SORT = "sort"
+ATTR_LIMIT = "limit"
+# Seconds a targeted refresh waits for more requests to merge with
+TEAM_REFRESH_COOLDOWN = 2.0
+# Functions listed in profile reports, matched against their file path
+PROFILE_SCOPE = r"custom_components[/\\]teamsnap[/\\]"
+PROFILE_SORT_KEYS = ("cumulative", "tottime", "calls")
+DEFAULT_PROFILE_LIMIT = 50
+
+# Bus event fired for every added, removed or changed event
+EVENT_EVENT_CHANGED = f"{DOMAIN}_event_changed"
+
 # Sensor attributes
 ATTR_NEXT_GAME = "next_game"
 ATTR_NEXT_GAME_DATE = "next_game_date"
@@ -23,3 +151,5 @@ ATTR_NEXT_PRACTICE = "next_practice"
 ATTR_UPCOMING_EVENTS = "upcoming_events"
 ATTR_TEAM_NAME = "team_name"
 ATTR_TEAM_ID = "team_id"
+ATTR_NEXT_GAME_AVAILABILITY = "next_game_availability"
+ATTR_NEXT_PRACTICE_AVAILABILITY = "next_practice_availability"
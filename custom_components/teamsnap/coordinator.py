@@ -2,20 +2,68 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
 import logging
+import time
 from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
 from .api import TeamSnapAPIClient, TeamSnapAPIError
-from .const import DEFAULT_UPDATE_INTERVAL, DOMAIN
+from .changes import EventChange, diff_events
+from .const import (
+    AVAILABILITY_DAYS,
+    DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_REFRESH_BUDGET,
+    DEFAULT_TEAMS_REFRESH_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    EVENT_EVENT_CHANGED,
+    OFFLOAD_MIN_EVENTS,
+    TEAM_REFRESH_COOLDOWN,
+)
+from .models import AvailabilitySummary, TeamSnapEvent
+from .ratelimit import time_budget
+from .retention import EventRetention, RetentionStats
+from .scheduler import PollScheduler
+from .shared import TeamSnapRegistry
+from .store import TeamSnapSnapshotStore
+from .sync import TeamSnapEventSync, day_ranges
+from .timeline import VIEW_GAMES, VIEW_PRACTICES, EventTimeline
+from .view import TeamSensorIndex, build_sensor_views
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class RefreshTier:
+    """Track when one slice of coordinator data is next due for a fetch."""
+
+    __slots__ = ("name", "interval", "last_refresh")
+
+    def __init__(self, name: str, interval: int) -> None:
+        """Initialize the tier."""
+        self.name = name
+        self.interval = timedelta(seconds=interval)
+        self.last_refresh: datetime | None = None
+
+    def due(self, now: datetime) -> bool:
+        """Return whether the tier should be fetched again."""
+        return self.last_refresh is None or now - self.last_refresh >= self.interval
+
+    def mark_refreshed(self, now: datetime) -> None:
+        """Record a successful fetch."""
+        self.last_refresh = now
+
+    def invalidate(self) -> None:
+        """Make the tier due on the next refresh."""
+        self.last_refresh = None
+
+
 class TeamSnapDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching TeamSnap data."""
 
@@ -24,6 +72,15 @@ class TeamSnapDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         api_client: TeamSnapAPIClient,
         update_interval: int = DEFAULT_UPDATE_INTERVAL,
+        fetch_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        event_sync: TeamSnapEventSync | None = None,
+        snapshot: TeamSnapSnapshotStore | None = None,
+        scheduler: PollScheduler | None = None,
+        teams_refresh_interval: int = DEFAULT_TEAMS_REFRESH_INTERVAL,
+        batch_search: bool = True,
+        refresh_budget: float = DEFAULT_REFRESH_BUDGET,
+        registry: TeamSnapRegistry | None = None,
+        retention: EventRetention | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -34,42 +91,64 @@ class TeamSnapDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         self.api_client = api_client
         self._teams: list[dict[str, Any]] = []
-        self._events: dict[int, list[dict[str, Any]]] = {}
+        self._teams_by_id: dict[int, dict[str, Any]] = {}
+        self._events: dict[int, list[TeamSnapEvent]] = {}
+        self._fetch_concurrency = max(1, fetch_concurrency)
+        self._fetch_durations: dict[int, float] = {}
+        self._batch_search = batch_search
+        self._refresh_budget = refresh_budget
+        self._registry = registry
+        self._event_sync = event_sync or TeamSnapEventSync(api_client)
+        self._retention = retention or EventRetention()
+        self._timeline = EventTimeline({})
+        self._team_index = TeamSensorIndex()
+        self._changes: list[EventChange] = []
+        self._availability: dict[int, AvailabilitySummary] = {}
+        self._availability_changed: set[int] = set()
+        self._sync_window_end: datetime | None = None
+        self._snapshot = snapshot
+        # True from a snapshot restore until a full refresh succeeds
+        self._serving_snapshot = False
+        self._scheduler = scheduler
+        self._poll_reason = "fixed interval"
+        # Events are synced on every refresh; teams only on their own tier
+        self._teams_tier = RefreshTier("teams", teams_refresh_interval)
+        # Teams queued for a targeted refresh, with the days to refetch;
+        # None means the team's whole window
+        self._pending_teams: dict[int, set[date] | None] = {}
+        # Full and targeted refreshes both replace the synced events
+        self._refresh_lock = asyncio.Lock()
+        self._team_refresh = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=TEAM_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self._async_refresh_pending_teams,
+        )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from TeamSnap API."""
+        # Retries and timeouts of every request share one budget per refresh
+        async with self._refresh_lock:
+            with self.api_client.metrics.refresh(), time_budget(
+                self._refresh_budget
+            ):
+                return await self._async_fetch_data()
+
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch and structure teams and events."""
         try:
-            # Fetch user's teams
-            teams = await self.api_client.async_get_teams()
-            if not teams:
-                _LOGGER.warning("No teams found for user")
+            # Teams change rarely, so they are only refetched when due
+            teams = await self._async_refresh_teams()
+            teams_changed = teams is not self._teams
             self._teams = teams
 
             # Fetch events for each team
-            events_by_team: dict[int, list[dict[str, Any]]] = {}
-            for team in teams:
-                team_id = team.get("id")
-                if team_id:
-                    try:
-                        events = await self.api_client.async_get_team_events(team_id)
-                        events_by_team[team_id] = events
-                    except TeamSnapAPIError as err:
-                        _LOGGER.warning(
-                            "Failed to fetch events for team %s: %s", team_id, err
-                        )
-                        # Continue with other teams even if one fails
-                        continue
+            events_by_team = await self._async_fetch_all_team_events(teams)
 
-            self._events = events_by_team
-
-            # Process and structure the data
-            return {
-                "teams": teams,
-                "events": events_by_team,
-                "next_game": self._get_next_game(events_by_team),
-                "next_practice": self._get_next_practice(events_by_team),
-                "upcoming_events_count": self._count_upcoming_events(events_by_team),
-            }
+            data = await self._async_process_events(teams_changed, events_by_team)
+            self._serving_snapshot = False
+            return data
         except TeamSnapAPIError as err:
             error_msg = str(err)
             if "Authentication failed" in error_msg or "401" in error_msg:
@@ -82,91 +161,393 @@ class TeamSnapDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.exception("Unexpected error fetching TeamSnap data: %s", err)
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
-    def _get_next_game(
-        self, events_by_team: dict[int, list[dict[str, Any]]]
-    ) -> dict[str, Any] | None:
-        """Get the next upcoming game."""
+    async def _async_process_events(
+        self,
+        teams_changed: bool,
+        events_by_team: dict[int, list[TeamSnapEvent]],
+    ) -> dict[str, Any]:
+        """Index freshly synced events and build the data for entities.
+
+        Teams whose events come back as the very same list are not diffed,
+        re-indexed or re-rendered, so a refresh that touched a few teams
+        only costs what those teams' slices cost.
+        """
+        metrics = self.api_client.metrics
+        with metrics.phase("index"):
+            # Evict whatever falls outside the window or over the team cap
+            window = self._event_sync.window()
+            previous_horizons = self._retention.horizons
+            events_by_team = self._retention.apply(
+                events_by_team, window, dt_util.utcnow()
+            )
+
+            # Unchanged teams come back as the very same cached lists
+            changed_teams = {
+                team_id
+                for team_id in events_by_team.keys() | self._events.keys()
+                if events_by_team.get(team_id) is not self._events.get(team_id)
+            }
+            self._changes = []
+            if changed_teams and self.data is not None:
+                # Diff against what entities last showed, restored or fetched
+                self._changes = diff_events(
+                    self._events,
+                    events_by_team,
+                    window,
+                    self._sync_window_end,
+                    self._retention.horizons,
+                    previous_horizons,
+                )
+            self._events = events_by_team
+            self._sync_window_end = window[1]
+
+            # Only the changed teams' events are re-sorted into the timeline
+            if changed_teams:
+                resorted = sum(
+                    len(events_by_team.get(team_id, ())) for team_id in changed_teams
+                )
+                if resorted >= OFFLOAD_MIN_EVENTS:
+                    # Entities keep reading the old timeline in the meantime
+                    self._timeline = await self.hass.async_add_executor_job(
+                        self._timeline.replace_teams, events_by_team, changed_teams
+                    )
+                else:
+                    self._timeline = self._timeline.replace_teams(
+                        events_by_team, changed_teams
+                    )
+
+        if self._snapshot is not None and (teams_changed or changed_teams):
+            self._snapshot.async_schedule_save(self._teams, events_by_team)
+
+        await self._async_refresh_availability()
+
+        with metrics.phase("views"):
+            data = self._build_data()
+        self._async_fire_changes()
+        return data
+
+    async def _async_refresh_teams(self) -> list[dict[str, Any]]:
+        """Return the team list, fetching it if the slow tier is due."""
         now = dt_util.utcnow()
-        next_game = None
-        next_game_time = None
+        if not self._teams_tier.due(now):
+            return self._teams
 
-        for team_id, events in events_by_team.items():
-            for event in events:
-                event_type = event.get("event_type", "").lower()
-                if "game" not in event_type and "match" not in event_type:
-                    continue
+        try:
+            teams = await self.api_client.async_get_teams()
+        except TeamSnapAPIError as err:
+            if not self._teams:
+                raise
+            _LOGGER.warning(
+                "Failed to refresh teams, keeping the previous list: %s", err
+            )
+            return self._teams
 
-                start_date = event.get("start_date")
-                if not start_date:
-                    continue
+        self._teams_tier.mark_refreshed(now)
+        if not teams:
+            _LOGGER.warning("No teams found for user")
+        if teams == self._teams:
+            return self._teams
+        _LOGGER.debug("Team list changed: %d teams", len(teams))
+        return teams
 
-                try:
-                    event_time = dt_util.parse_datetime(start_date)
-                    if event_time and event_time > now:
-                        if next_game_time is None or event_time < next_game_time:
-                            next_game_time = event_time
-                            next_game = {
-                                **event,
-                                "team_id": team_id,
-                            }
-                except (ValueError, TypeError):
-                    continue
-
-        return next_game
-
-    def _get_next_practice(
-        self, events_by_team: dict[int, list[dict[str, Any]]]
-    ) -> dict[str, Any] | None:
-        """Get the next upcoming practice."""
+    async def _async_refresh_availability(self) -> None:
+        """Fetch availability counts for the upcoming events in one batch.
+
+        Only events in the next ``AVAILABILITY_DAYS`` are looked up. The map
+        is kept as the same object when nothing changed, and the teams whose
+        counts did change are recorded for the per-team sensors.
+        """
         now = dt_util.utcnow()
-        next_practice = None
-        next_practice_time = None
+        upcoming = {
+            event.id: event.team_id
+            for event in self._timeline.between(
+                now, now + timedelta(days=AVAILABILITY_DAYS)
+            )
+            if event.id is not None
+        }
+        if not upcoming:
+            if self._availability:
+                self._availability_changed = set(self._teams_by_id)
+                self._availability = {}
+            return
 
-        for team_id, events in events_by_team.items():
-            for event in events:
-                event_type = event.get("event_type", "").lower()
-                if "practice" not in event_type:
-                    continue
+        fetched = await self.api_client.async_get_availability(
+            upcoming, self._fetch_concurrency
+        )
+        availability: dict[int, AvailabilitySummary] = {}
+        for event_id in upcoming:
+            # Events of a failed chunk keep their last known counts
+            summary = fetched.get(event_id) or self._availability.get(event_id)
+            if summary is not None:
+                availability[event_id] = summary
 
-                start_date = event.get("start_date")
-                if not start_date:
-                    continue
+        if availability != self._availability:
+            # Events that left the window changed their team's events anyway
+            self._availability_changed = {
+                team_id
+                for event_id, team_id in upcoming.items()
+                if availability.get(event_id) != self._availability.get(event_id)
+            }
+            self._availability = availability
 
-                try:
-                    event_time = dt_util.parse_datetime(start_date)
-                    if event_time and event_time > now:
-                        if next_practice_time is None or event_time < next_practice_time:
-                            next_practice_time = event_time
-                            next_practice = {
-                                **event,
-                                "team_id": team_id,
-                            }
-                except (ValueError, TypeError):
-                    continue
-
-        return next_practice
-
-    def _count_upcoming_events(
-        self, events_by_team: dict[int, list[dict[str, Any]]]
-    ) -> int:
-        """Count all upcoming events."""
+    def _async_fire_changes(self) -> None:
+        """Fire a bus event for every change found on this refresh."""
+        if not self._changes:
+            return
+        _LOGGER.debug("%d events changed", len(self._changes))
+        entry_id = self.config_entry.entry_id if self.config_entry else None
+        for change in self._changes:
+            event_data = change.as_dict()
+            team = self._teams_by_id.get(change.event.team_id)
+            event_data["team_name"] = team.get("name") if team else None
+            event_data["entry_id"] = entry_id
+            self.hass.bus.async_fire(EVENT_EVENT_CHANGED, event_data)
+
+    async def async_request_team_refresh(
+        self,
+        team_ids: Iterable[int] | None = None,
+        days: Iterable[date] | None = None,
+    ) -> None:
+        """Queue a refresh of some teams' events.
+
+        Requests arriving within the cooldown are merged into one fetch
+        covering every team asked for. With ``days``, only events starting
+        on those days are refetched; otherwise the team's whole window is.
+        Without ``team_ids``, every team is refreshed this way.
+        """
+        if self.data is None:
+            # Nothing to merge into yet
+            await self.async_request_refresh()
+            return
+        requested = set(team_ids) if team_ids is not None else set(self._teams_by_id)
+        for team_id in requested & self._teams_by_id.keys():
+            pending = self._pending_teams.get(team_id, set())
+            # A whole-window refresh covers any days
+            if pending is None or not days:
+                self._pending_teams[team_id] = None
+            else:
+                self._pending_teams[team_id] = pending | set(days)
+        if self._pending_teams:
+            await self._team_refresh.async_call()
+
+    async def _async_refresh_pending_teams(self) -> None:
+        """Fetch the queued teams and merge them into the current data."""
+        # Requests made while a fetch runs are picked up by the next pass
+        while self._pending_teams:
+            pending, self._pending_teams = self._pending_teams, {}
+            try:
+                async with self._refresh_lock:
+                    with self.api_client.metrics.refresh(), time_budget(
+                        self._refresh_budget
+                    ):
+                        fetched = await self._async_fetch_pending_teams(pending)
+                        data = await self._async_process_events(
+                            False, {**self._events, **fetched}
+                        )
+            except TeamSnapAPIError as err:
+                _LOGGER.warning(
+                    "Failed to refresh teams %s: %s", sorted(pending), err
+                )
+                return
+            _LOGGER.debug("Refreshed teams %s", sorted(fetched))
+            # Unlike async_set_updated_data, this leaves the next poll where
+            # it is, so frequent targeted refreshes cannot keep delaying it
+            self.data = data
+            self.async_update_listeners()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any queued targeted refresh along with the polling."""
+        await super().async_shutdown()
+        self._pending_teams.clear()
+        self._team_refresh.async_shutdown()
+        if self._snapshot is not None:
+            # A delayed save must not outlive the entry, or recreate its file
+            await self._snapshot.async_flush()
+
+    async def _async_fetch_pending_teams(
+        self, pending: dict[int, set[date] | None]
+    ) -> dict[int, list[TeamSnapEvent]]:
+        """Fetch queued teams, by day where days were given."""
+        by_day = {
+            team_id: days
+            for team_id, days in pending.items()
+            if days and team_id in self._events
+        }
+        fetched: dict[int, list[TeamSnapEvent]] = {}
+        if by_day:
+            fetched = await self._event_sync.async_sync_ranges(
+                self._events,
+                list(by_day),
+                day_ranges(set().union(*by_day.values())),
+                self._fetch_concurrency,
+            )
+
+        # Teams without days, or whose day search failed, get a full sync
+        full = [team_id for team_id in pending if team_id not in fetched]
+        if full:
+            self._event_sync.invalidate(full)
+            fetched.update(await self._async_fetch_team_events(full, {}))
+        return fetched
+
+    def async_invalidate_teams(self) -> None:
+        """Refetch the team list on the next refresh."""
+        self._teams_tier.invalidate()
+
+    def _build_data(self) -> dict[str, Any]:
+        """Structure the cached teams and events for entities."""
+        timeline = self._timeline
         now = dt_util.utcnow()
-        count = 0
 
-        for events in events_by_team.values():
-            for event in events:
-                start_date = event.get("start_date")
-                if not start_date:
-                    continue
+        if self._scheduler is not None:
+            # Picked up when the next refresh is scheduled
+            self.update_interval, self._poll_reason = (
+                self._scheduler.next_interval(timeline, now)
+            )
+
+        teams_by_id = {team["id"]: team for team in self._teams if team.get("id")}
+        self._teams_by_id = teams_by_id
+        data: dict[str, Any] = {
+            "teams": self._teams,
+            "teams_by_id": teams_by_id,
+            "next_game": timeline.next_after(now, VIEW_GAMES),
+            "next_practice": timeline.next_after(now, VIEW_PRACTICES),
+            "upcoming_events_count": timeline.count_after(now),
+            "changes": self._changes,
+            "availability": self._availability,
+        }
+        # Entity values are computed here once, not per entity property read
+        data["sensors"] = build_sensor_views(data)
+        # Per-team views are only recomputed for teams that changed
+        data["changed_teams"] = self._team_index.update(
+            teams_by_id,
+            self._events,
+            now,
+            self._availability,
+            self._availability_changed,
+        )
+        self._availability_changed = set()
+        data["team_sensors"] = self._team_index.views
+        return data
+
+    async def async_restore_snapshot(self) -> bool:
+        """Load the last saved snapshot as the current data, if any."""
+        if self._snapshot is None:
+            return False
+        snapshot = await self._snapshot.async_load()
+        if snapshot is None:
+            return False
+
+        self._teams, self._events = snapshot
+        self._timeline = await self.hass.async_add_executor_job(
+            EventTimeline, self._events
+        )
+        self.data = self._build_data()
+        self._serving_snapshot = True
+        _LOGGER.debug(
+            "Restored TeamSnap snapshot with %d teams and %d events",
+            len(self._teams),
+            len(self._timeline),
+        )
+        return True
+
+    async def _async_fetch_all_team_events(
+        self, teams: list[dict[str, Any]]
+    ) -> dict[int, list[TeamSnapEvent]]:
+        """Get events for all teams, sharing work with other entries.
+
+        Only teams in this entry's own team list are looked up, so results
+        fetched with another entry's token are never exposed to an entry
+        that could not see that team itself.
+        """
+        team_ids = [team.get("id") for team in teams if team.get("id")]
+        start = time.monotonic()
+        durations: dict[int, float] = {}
+
+        shared: dict[int, list[TeamSnapEvent]] = {}
+        waiting: dict[int, asyncio.Future[list[TeamSnapEvent] | None]] = {}
+        to_fetch = team_ids
+        if self._registry is not None:
+            shared, waiting, to_fetch = self._registry.claim_teams(team_ids)
+
+        fetched: dict[int, list[TeamSnapEvent]] = {}
+        try:
+            fetched = await self._async_fetch_team_events(to_fetch, durations)
+        finally:
+            if self._registry is not None:
+                # Waiting entries are released even if this fetch blew up
+                self._registry.publish(to_fetch, fetched)
+
+        events_by_team = {**shared, **fetched}
+        for team_id, future in waiting.items():
+            events = await future
+            if events is not None:
+                events_by_team[team_id] = events
+        for team_id in team_ids:
+            if team_id not in events_by_team and team_id in self._events:
+                # Keep whatever was last synced for a team that failed
+                events_by_team[team_id] = self._events[team_id]
+
+        self._fetch_durations = durations
+        for team_id in self._events.keys() - set(team_ids):
+            self._event_sync.forget_team(team_id)
+        _LOGGER.debug(
+            "Got events for %d teams in %.2fs (%d fetched, %d shared, "
+            "concurrency %d, slowest %.2fs)",
+            len(team_ids),
+            time.monotonic() - start,
+            len(to_fetch),
+            len(shared) + len(waiting),
+            self._fetch_concurrency,
+            max(durations.values(), default=0.0),
+        )
+
+        return events_by_team
 
+    async def _async_fetch_team_events(
+        self, team_ids: list[int], durations: dict[int, float]
+    ) -> dict[int, list[TeamSnapEvent]]:
+        """Fetch events for teams with a bounded number in flight.
+
+        Teams are synced through batched event searches by default, with
+        per-team fetches only for teams whose search failed. Teams that
+        could not be fetched at all are left out.
+        """
+        semaphore = asyncio.Semaphore(self._fetch_concurrency)
+
+        async def _fetch(team_id: int) -> list[TeamSnapEvent] | None:
+            async with semaphore:
+                start = time.monotonic()
+                cached = self._events.get(team_id)
                 try:
-                    event_time = dt_util.parse_datetime(start_date)
-                    if event_time and event_time > now:
-                        count += 1
-                except (ValueError, TypeError):
-                    continue
+                    return await self._event_sync.async_sync_team(team_id, cached)
+                except TeamSnapAPIError as err:
+                    _LOGGER.warning(
+                        "Failed to fetch events for team %s: %s", team_id, err
+                    )
+                    # Continue with other teams even if one fails
+                    return None
+                finally:
+                    durations[team_id] = time.monotonic() - start
+
+        start = time.monotonic()
+        events_by_team: dict[int, list[TeamSnapEvent]] = {}
 
-        return count
+        if self._batch_search and team_ids:
+            events_by_team = await self._event_sync.async_sync_teams(
+                self._events, team_ids, self._fetch_concurrency
+            )
+            batch_elapsed = time.monotonic() - start
+            for team_id in events_by_team:
+                durations[team_id] = batch_elapsed
+
+        # Teams whose batched search failed fall back to per-team fetches
+        remaining = [team_id for team_id in team_ids if team_id not in events_by_team]
+        results = await asyncio.gather(*(_fetch(team_id) for team_id in remaining))
+        for team_id, events in zip(remaining, results, strict=True):
+            if events is not None:
+                events_by_team[team_id] = events
+
+        return events_by_team
 
     @property
     def teams(self) -> list[dict[str, Any]]:
@@ -174,6 +555,46 @@ class TeamSnapDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return self._teams
 
     @property
-    def events(self) -> dict[int, list[dict[str, Any]]]:
+    def teams_by_id(self) -> dict[int, dict[str, Any]]:
+        """Return the cached teams keyed by id."""
+        return self._teams_by_id
+
+    @property
+    def events(self) -> dict[int, list[TeamSnapEvent]]:
         """Return the cached events."""
         return self._events
+
+    @property
+    def timeline(self) -> EventTimeline:
+        """Return the event timeline built on the last refresh."""
+        return self._timeline
+
+    @property
+    def retention_stats(self) -> RetentionStats:
+        """Return how many events are retained and their estimated size."""
+        return self._retention.stats(self._events)
+
+    @property
+    def changes(self) -> list[EventChange]:
+        """Return the event changes found on the last refresh."""
+        return self._changes
+
+    @property
+    def availability(self) -> dict[int, AvailabilitySummary]:
+        """Return member availability counts of upcoming events by event id."""
+        return self._availability
+
+    @property
+    def serving_snapshot(self) -> bool:
+        """Return whether the data is still the snapshot restored at startup."""
+        return self._serving_snapshot
+
+    @property
+    def poll_reason(self) -> str:
+        """Return why the current update interval was chosen."""
+        return self._poll_reason
+
+    @property
+    def fetch_durations(self) -> dict[int, float]:
+        """Return how long each team's event fetch took on the last refresh."""
+        return self._fetch_durations
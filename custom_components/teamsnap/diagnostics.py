@@ -0,0 +1,55 @@
+"""Diagnostics support for TeamSnap."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import TeamSnapDataUpdateCoordinator
+
+TO_REDACT = {"token", "access_token", "refresh_token", "id_token"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: TeamSnapDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "polling": {
+            "update_interval": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "reason": coordinator.poll_reason,
+            "last_update_success": coordinator.last_update_success,
+        },
+        "circuits": coordinator.api_client.circuit_states,
+        "discovery": _discovery_diagnostics(coordinator),
+        "retention": coordinator.retention_stats._asdict(),
+        "metrics": async_redact_data(
+            coordinator.api_client.metrics.as_dict(), TO_REDACT
+        ),
+    }
+
+
+def _discovery_diagnostics(
+    coordinator: TeamSnapDataUpdateCoordinator,
+) -> dict[str, Any] | None:
+    """Return what the discovered API root advertises."""
+    root = coordinator.api_client.discovery.root
+    if root is None:
+        return None
+    return {
+        "fetched_at": dt_util.utc_from_timestamp(root.fetched_at).isoformat(),
+        "links": sorted(root.links),
+        "queries": sorted(root.queries),
+    }
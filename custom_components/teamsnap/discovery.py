@@ -0,0 +1,212 @@
+"""Hypermedia discovery of TeamSnap API endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DISCOVERY_RETRY_INTERVAL,
+    DISCOVERY_TTL,
+    DOMAIN,
+    STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Paths used when the root document is unavailable or does not advertise a rel
+DEFAULT_ENDPOINTS: dict[str, str] = {
+    "me": "/me",
+    "teams": "/teams",
+    "events": "/events",
+    "events_search": "/events/search",
+    "availabilities": "/availabilities",
+    "availabilities_search": "/availabilities/search",
+    "team_events": "/teams/{team_id}/events",
+}
+
+_SEARCH_SUFFIX = "_search"
+
+
+class HypermediaRoot:
+    """Links and queries advertised by the API root document."""
+
+    __slots__ = ("links", "queries", "fetched_at")
+
+    def __init__(
+        self,
+        links: dict[str, str],
+        queries: dict[str, tuple[str, frozenset[str]]],
+        fetched_at: float,
+    ) -> None:
+        """Initialize the root from its link and query maps."""
+        self.links = links
+        self.queries = queries
+        self.fetched_at = fetched_at
+
+    @classmethod
+    def from_document(cls, document: dict[str, Any]) -> HypermediaRoot:
+        """Build the root from a Collection+JSON document."""
+        collection = document.get("collection") or {}
+        links = {
+            link["rel"]: link["href"]
+            for link in collection.get("links") or []
+            if link.get("rel") and link.get("href")
+        }
+        queries = {
+            query["rel"]: (
+                query["href"],
+                frozenset(
+                    field["name"]
+                    for field in query.get("data") or []
+                    if "name" in field
+                ),
+            )
+            for query in collection.get("queries") or []
+            if query.get("rel") and query.get("href")
+        }
+        return cls(links, queries, time.time())
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> HypermediaRoot:
+        """Restore a root saved with ``as_dict``."""
+        return cls(
+            dict(data["links"]),
+            {
+                rel: (href, frozenset(params))
+                for rel, (href, params) in data["queries"].items()
+            },
+            float(data["fetched_at"]),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the root in its stored form."""
+        return {
+            "links": self.links,
+            "queries": {
+                rel: [href, sorted(params)]
+                for rel, (href, params) in self.queries.items()
+            },
+            "fetched_at": self.fetched_at,
+        }
+
+    def resolve(self, rel: str) -> str | None:
+        """Return the advertised href for a rel, if there is one.
+
+        A ``<name>_search`` rel that is not advertised as a query of its own
+        is taken to be the ``search`` resource under the ``<name>`` link.
+        """
+        if rel in self.queries:
+            return self.queries[rel][0]
+        if rel in self.links:
+            return self.links[rel]
+        if rel.endswith(_SEARCH_SUFFIX):
+            base = self.links.get(rel.removesuffix(_SEARCH_SUFFIX))
+            if base:
+                return f"{base.rstrip('/')}/search"
+        return None
+
+    def query_params(self, rel: str) -> frozenset[str] | None:
+        """Return the parameters a query advertises, or None if unknown."""
+        query = self.queries.get(rel)
+        return query[1] if query else None
+
+
+class TeamSnapDiscovery:
+    """Fetch the API root once and keep its links for ``DISCOVERY_TTL``.
+
+    The root is the same for every account, so one instance is shared by
+    all entries and persisted across restarts. Until a root is available,
+    and for rels it does not advertise, endpoints resolve to the built-in
+    default paths.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant | None = None, ttl: float = DISCOVERY_TTL
+    ) -> None:
+        """Initialize discovery, persisted when given a hass instance."""
+        self._store: Store[dict[str, Any]] | None = (
+            Store(hass, STORAGE_VERSION, f"{DOMAIN}.discovery") if hass else None
+        )
+        self._ttl = ttl
+        self._root: HypermediaRoot | None = None
+        self._loaded = self._store is None
+        self._retry_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def root(self) -> HypermediaRoot | None:
+        """Return the current root document, if one was fetched."""
+        return self._root
+
+    def endpoint(self, rel: str) -> str:
+        """Return the endpoint for a rel from the root or the defaults."""
+        if self._root is not None and (href := self._root.resolve(rel)):
+            return href
+        return DEFAULT_ENDPOINTS[rel]
+
+    def supports(self, rel: str, param: str) -> bool:
+        """Return whether a query accepts a parameter, assuming so if unknown."""
+        params = self._root.query_params(rel) if self._root else None
+        return params is None or param in params
+
+    def advertises(self, rel: str, param: str) -> bool:
+        """Return whether a query is known to accept a parameter."""
+        params = self._root.query_params(rel) if self._root else None
+        return params is not None and param in params
+
+    async def async_ensure(
+        self, fetch: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> None:
+        """Load or refetch the root if it is missing or past its TTL.
+
+        Concurrent callers share one fetch. A failed fetch keeps whatever
+        root was known and is not retried for ``DISCOVERY_RETRY_INTERVAL``.
+        """
+        if self._fresh():
+            return
+        async with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                await self._async_load()
+            now = time.time()
+            if self._fresh() or now < self._retry_at:
+                return
+            try:
+                root = HypermediaRoot.from_document(await fetch())
+            except Exception as err:  # Discovery must never break a refresh
+                _LOGGER.debug("Failed to fetch the TeamSnap API root: %s", err)
+                self._retry_at = now + DISCOVERY_RETRY_INTERVAL
+                return
+            _LOGGER.debug(
+                "Discovered %d links and %d queries",
+                len(root.links),
+                len(root.queries),
+            )
+            self._root = root
+            if self._store is not None:
+                await self._store.async_save(root.as_dict())
+
+    def _fresh(self) -> bool:
+        """Return whether the root is known and within its TTL."""
+        return (
+            self._loaded
+            and self._root is not None
+            and time.time() - self._root.fetched_at < self._ttl
+        )
+
+    async def _async_load(self) -> None:
+        """Load the root saved by an earlier run."""
+        assert self._store is not None
+        try:
+            data = await self._store.async_load()
+            if data:
+                self._root = HypermediaRoot.from_dict(data)
+        except Exception as err:  # A corrupt file only costs a refetch
+            _LOGGER.warning("Failed to load saved TeamSnap API root: %s", err)
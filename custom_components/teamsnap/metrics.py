@@ -0,0 +1,242 @@
+"""Refresh instrumentation for the TeamSnap integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+import time
+from typing import Any, NamedTuple
+
+from homeassistant.util import dt as dt_util
+
+from .const import METRICS_HISTORY
+
+# Upper bounds (seconds) of the request latency histogram buckets; slower
+# requests land in a final overflow bucket
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class EndpointStats:
+    """Running totals for one endpoint, with ids collapsed out of the path."""
+
+    __slots__ = (
+        "requests",
+        "statuses",
+        "latency",
+        "histogram",
+        "bytes",
+        "wire_bytes",
+        "read",
+        "decode",
+        "offloaded",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the totals."""
+        self.requests = 0
+        self.statuses: dict[str, int] = {}
+        self.latency = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.bytes = 0
+        self.wire_bytes = 0
+        self.read = 0.0
+        self.decode = 0.0
+        self.offloaded = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the totals for diagnostics."""
+        labels = [f"le_{bound:g}" for bound in LATENCY_BUCKETS] + ["overflow"]
+        return {
+            "requests": self.requests,
+            "statuses": dict(sorted(self.statuses.items())),
+            "latency_total": round(self.latency, 4),
+            "latency_histogram": dict(zip(labels, self.histogram, strict=True)),
+            "bytes": self.bytes,
+            "wire_bytes": self.wire_bytes,
+            "read_time": round(self.read, 4),
+            "decode_time": round(self.decode, 4),
+            "offloaded_decode_time": round(self.offloaded, 4),
+        }
+
+
+class RefreshRecord(NamedTuple):
+    """Where the time of one refresh went.
+
+    ``network`` and ``decode`` are summed over requests, so concurrent
+    fetches can add up to more than the refresh took. ``decode`` blocked
+    the event loop; ``offloaded`` is decoding done in the executor, which
+    did not. Whatever is left of ``duration`` was spent waiting on the
+    rate limiter or retry backoff. ``bytes`` counts decoded bodies and
+    ``wire_bytes`` what was transferred, which is less when compressed.
+    """
+
+    started: float
+    duration: float
+    network: float
+    decode: float
+    offloaded: float
+    index_time: float
+    views_time: float
+    requests: int
+    bytes: int
+    wire_bytes: int
+    success: bool
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record for diagnostics."""
+        data: dict[str, Any] = {
+            field: round(value, 4) if isinstance(value, float) else value
+            for field, value in self._asdict().items()
+        }
+        data["started"] = dt_util.utc_from_timestamp(self.started).isoformat()
+        return data
+
+
+class _RefreshTotals:
+    """Accumulator for the refresh in progress."""
+
+    __slots__ = (
+        "network",
+        "decode",
+        "offloaded",
+        "phases",
+        "requests",
+        "bytes",
+        "wire_bytes",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the accumulator."""
+        self.network = 0.0
+        self.decode = 0.0
+        self.offloaded = 0.0
+        self.phases: dict[str, float] = {}
+        self.requests = 0
+        self.bytes = 0
+        self.wire_bytes = 0
+
+
+class RefreshMetrics:
+    """Per-endpoint request statistics and a ring buffer of recent refreshes.
+
+    Recording is a few additions per request or decoded chunk, cheap enough
+    to stay on permanently. Requests made outside a refresh only count
+    towards the endpoint totals.
+    """
+
+    def __init__(self, history: int = METRICS_HISTORY) -> None:
+        """Initialize the metrics."""
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.refreshes: deque[RefreshRecord] = deque(maxlen=history)
+        self._current: _RefreshTotals | None = None
+
+    @property
+    def last_refresh(self) -> RefreshRecord | None:
+        """Return the most recent completed refresh, if any."""
+        return self.refreshes[-1] if self.refreshes else None
+
+    def _endpoint(self, endpoint: str) -> EndpointStats:
+        """Return the totals of an endpoint, creating them on first use."""
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = EndpointStats()
+        return stats
+
+    def record_response(
+        self, endpoint: str, status: int | str, latency: float
+    ) -> None:
+        """Record one request, from sending it to receiving the headers.
+
+        Failed connections are recorded with a status such as ``"timeout"``.
+        """
+        stats = self._endpoint(endpoint)
+        stats.requests += 1
+        key = str(status)
+        stats.statuses[key] = stats.statuses.get(key, 0) + 1
+        stats.latency += latency
+        stats.histogram[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        if self._current is not None:
+            self._current.requests += 1
+            self._current.network += latency
+
+    def record_body(
+        self,
+        endpoint: str,
+        size: int,
+        read: float,
+        decode: float,
+        offloaded: float = 0.0,
+        wire: int | None = None,
+    ) -> None:
+        """Record a response body: its size, read time and decode time.
+
+        ``decode`` is time spent decoding on the event loop, ``offloaded``
+        time spent decoding in the executor. ``wire`` is the size that was
+        transferred, if it differs from the decoded ``size``.
+        """
+        wire = size if wire is None else wire
+        stats = self._endpoint(endpoint)
+        stats.bytes += size
+        stats.wire_bytes += wire
+        stats.read += read
+        stats.decode += decode
+        stats.offloaded += offloaded
+        if self._current is not None:
+            self._current.bytes += size
+            self._current.wire_bytes += wire
+            self._current.network += read
+            self._current.decode += decode
+            self._current.offloaded += offloaded
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a post-processing step of the refresh in progress."""
+        if self._current is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            phases = self._current.phases
+            phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+    @contextmanager
+    def refresh(self) -> Iterator[None]:
+        """Time a whole refresh and add it to the ring buffer."""
+        totals = self._current = _RefreshTotals()
+        started = time.time()
+        start = time.perf_counter()
+        success = False
+        try:
+            yield
+            success = True
+        finally:
+            self._current = None
+            self.refreshes.append(
+                RefreshRecord(
+                    started,
+                    time.perf_counter() - start,
+                    totals.network,
+                    totals.decode,
+                    totals.offloaded,
+                    totals.phases.get("index", 0.0),
+                    totals.phases.get("views", 0.0),
+                    totals.requests,
+                    totals.bytes,
+                    totals.wire_bytes,
+                    success,
+                )
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every statistic for diagnostics."""
+        return {
+            "endpoints": {
+                endpoint: stats.as_dict()
+                for endpoint, stats in sorted(self.endpoints.items())
+            },
+            "refreshes": [record.as_dict() for record in self.refreshes],
+        }
@@ -0,0 +1,160 @@
+"""Data models for the TeamSnap integration."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from enum import StrEnum
+from typing import Any, NamedTuple
+
+from homeassistant.util import dt as dt_util
+
+from .const import DEFAULT_EVENT_DURATION
+
+
+class EventKind(StrEnum):
+    """Kind of a TeamSnap event."""
+
+    GAME = "game"
+    PRACTICE = "practice"
+    OTHER = "other"
+
+
+# Availability status codes used by the TeamSnap API
+AVAILABILITY_NO = 0
+AVAILABILITY_YES = 1
+AVAILABILITY_MAYBE = 2
+
+
+class AvailabilitySummary(NamedTuple):
+    """Member availability counts for one event."""
+
+    going: int = 0
+    not_going: int = 0
+    maybe: int = 0
+    unknown: int = 0
+
+    @classmethod
+    def from_status_codes(cls, codes: list[int | None]) -> AvailabilitySummary:
+        """Count the availability status codes of an event's members."""
+        going = codes.count(AVAILABILITY_YES)
+        not_going = codes.count(AVAILABILITY_NO)
+        maybe = codes.count(AVAILABILITY_MAYBE)
+        return cls(going, not_going, maybe, len(codes) - going - not_going - maybe)
+
+
+def _event_kind(data: dict[str, Any]) -> EventKind:
+    """Classify an event from its API fields."""
+    if data.get("is_game"):
+        return EventKind.GAME
+    event_type = (data.get("event_type") or "").lower()
+    if "game" in event_type or "match" in event_type:
+        return EventKind.GAME
+    if "practice" in event_type:
+        return EventKind.PRACTICE
+    return EventKind.OTHER
+
+
+def _parse_start(value: Any) -> datetime | None:
+    """Parse an API start date into an aware UTC datetime."""
+    if not value:
+        return None
+    try:
+        parsed = dt_util.parse_datetime(value)
+    except (ValueError, TypeError):
+        return None
+    if parsed is None:
+        return None
+    # Naive times are taken as local so every start is comparable
+    return dt_util.as_utc(parsed)
+
+
+def _parse_duration(value: Any) -> int | None:
+    """Parse an API duration in minutes."""
+    try:
+        duration = int(value)
+    except (TypeError, ValueError):
+        return None
+    return duration if duration > 0 else None
+
+
+class TeamSnapEvent:
+    """A TeamSnap event reduced to the fields the integration uses."""
+
+    __slots__ = (
+        "id",
+        "team_id",
+        "name",
+        "start",
+        "kind",
+        "location",
+        "opponent",
+        "duration",
+    )
+
+    def __init__(
+        self,
+        id: int | None,
+        team_id: int,
+        name: str | None,
+        start: datetime | None,
+        kind: EventKind,
+        location: str | None = None,
+        opponent: str | None = None,
+        duration: int | None = None,
+    ) -> None:
+        """Initialize the event."""
+        self.id = id
+        self.team_id = team_id
+        self.name = name
+        self.start = start
+        self.kind = kind
+        self.location = location
+        self.opponent = opponent
+        self.duration = duration
+
+    @property
+    def end(self) -> datetime | None:
+        """Return when the event ends, assuming a default length if unknown."""
+        if self.start is None:
+            return None
+        return self.start + self.length
+
+    @property
+    def content_hash(self) -> int:
+        """Return a hash of the fields shown to users, for change detection."""
+        return hash(
+            (
+                self.name,
+                self.start,
+                self.kind,
+                self.location,
+                self.opponent,
+                self.duration,
+            )
+        )
+
+    @property
+    def length(self) -> timedelta:
+        """Return how long the event lasts."""
+        return timedelta(minutes=self.duration or DEFAULT_EVENT_DURATION)
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any], team_id: int) -> TeamSnapEvent:
+        """Create an event from a flattened API item."""
+        return cls(
+            id=data.get("id"),
+            team_id=data.get("team_id") or team_id,
+            name=data.get("name"),
+            start=_parse_start(data.get("start_date")),
+            kind=_event_kind(data),
+            location=data.get("location_name"),
+            opponent=data.get("opponent_name"),
+            duration=_parse_duration(data.get("duration_in_minutes")),
+        )
+
+    def __repr__(self) -> str:
+        """Return a debug representation of the event."""
+        return (
+            f"TeamSnapEvent(id={self.id!r}, team_id={self.team_id!r}, "
+            f"kind={self.kind.value}, start={self.start!r})"
+        )
@@ -0,0 +1,159 @@
+"""Rate limiting, retry and circuit breaking for TeamSnap API requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+import random
+import re
+import time
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DEFAULT_BREAKER_RESET_TIMEOUT,
+    DEFAULT_BREAKER_THRESHOLD,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_LIMIT_BURST,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+)
+
+# Deadline (monotonic seconds) of the refresh the current task belongs to.
+# Tasks spawned during a refresh inherit it through their context.
+_DEADLINE: ContextVar[float | None] = ContextVar("teamsnap_deadline", default=None)
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+@contextmanager
+def time_budget(seconds: float) -> Iterator[None]:
+    """Bound every request made inside the block by a shared deadline."""
+    token = _DEADLINE.set(time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def remaining_budget() -> float | None:
+    """Return the seconds left in the current time budget, if there is one."""
+    deadline = _DEADLINE.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def endpoint_key(path: str) -> str:
+    """Return a path with numeric ids collapsed, e.g. /teams/{id}/events."""
+    return _ID_SEGMENT.sub("/{id}", path)
+
+
+def retry_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Return how long to wait before retry number ``attempt``.
+
+    A ``Retry-After`` header (seconds or an HTTP date) wins; otherwise the
+    delay is exponential backoff with full jitter.
+    """
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            when = None
+        if when is not None:
+            return max(0.0, (when - dt_util.utcnow()).total_seconds())
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+
+
+class TokenBucket:
+    """Token bucket limiting how fast requests are sent."""
+
+    def __init__(
+        self, rate: float = DEFAULT_RATE_LIMIT, burst: int = DEFAULT_RATE_LIMIT_BURST
+    ) -> None:
+        """Initialize the bucket full."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self._rate
+                await asyncio.sleep(wait)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+
+class CircuitBreaker:
+    """Fail fast for an endpoint after repeated failures.
+
+    After ``threshold`` consecutive failures the circuit opens and requests
+    are refused until ``reset_timeout`` has passed. One trial request is then
+    let through: success closes the circuit, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        threshold: int = DEFAULT_BREAKER_THRESHOLD,
+        reset_timeout: float = DEFAULT_BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize the breaker closed."""
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_started: float | None = None
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self._reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Return whether a request may be sent now."""
+        state = self.state
+        if state == "closed":
+            return True
+        now = time.monotonic()
+        if state == "half_open" and (
+            # A trial that never reported back does not block forever
+            self._trial_started is None
+            or now - self._trial_started >= self._reset_timeout
+        ):
+            self._trial_started = now
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a request the endpoint answered properly."""
+        self._failures = 0
+        self._opened_at = None
+        self._trial_started = None
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if needed."""
+        self._failures += 1
+        if self._trial_started is not None or self._failures >= self._threshold:
+            self._opened_at = time.monotonic()
+        self._trial_started = None
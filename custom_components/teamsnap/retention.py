@@ -0,0 +1,138 @@
+"""Bounded retention of synced TeamSnap events."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+import sys
+from typing import NamedTuple
+
+from .const import DEFAULT_MAX_EVENTS_PER_TEAM
+from .models import TeamSnapEvent
+
+_LOGGER = logging.getLogger(__name__)
+
+# A team's list as given, the window it was trimmed for, and what was kept
+_Applied = tuple[list[TeamSnapEvent], tuple[datetime, datetime], list[TeamSnapEvent]]
+
+
+class RetentionStats(NamedTuple):
+    """How many events are retained and roughly how much memory they use."""
+
+    events: int
+    evicted: int
+    estimated_bytes: int
+
+
+class EventRetention:
+    """Keep each team's events inside the sync window and under a cap.
+
+    Applied to every team on every refresh, whether its events were just
+    synced, shared by another entry, kept after a failed fetch or restored
+    from the snapshot. A team whose events are all kept gets its very same
+    list back, and a list already trimmed for the same window is not
+    trimmed again, so change detection downstream is unaffected.
+
+    When a team has more events than the cap, upcoming events are kept
+    first, earliest first, then the most recent past ones. The start of
+    the last upcoming event kept becomes that team's horizon: events past
+    it were evicted, not cancelled.
+    """
+
+    def __init__(self, max_per_team: int = DEFAULT_MAX_EVENTS_PER_TEAM) -> None:
+        """Initialize the policy."""
+        self._max_per_team = max(1, max_per_team)
+        self._evicted = 0
+        self._applied: dict[int, _Applied] = {}
+        self.horizons: dict[int, datetime] = {}
+
+    def apply(
+        self,
+        events_by_team: dict[int, list[TeamSnapEvent]],
+        window: tuple[datetime, datetime],
+        now: datetime,
+    ) -> dict[int, list[TeamSnapEvent]]:
+        """Return events with everything outside the policy evicted."""
+        window_start, window_end = window
+        retained: dict[int, list[TeamSnapEvent]] = {}
+        horizons: dict[int, datetime] = {}
+        applied: dict[int, _Applied] = {}
+        evicted = 0
+
+        for team_id, events in events_by_team.items():
+            previous = self._applied.get(team_id)
+            if previous and previous[0] is events and previous[1] == window:
+                kept = previous[2]
+                if team_id in self.horizons:
+                    horizons[team_id] = self.horizons[team_id]
+            else:
+                # Undated events are kept, as the sync keeps them
+                kept = [
+                    event
+                    for event in events
+                    if event.start is None
+                    or window_start <= event.start <= window_end
+                ]
+                if len(kept) > self._max_per_team:
+                    kept, horizon = self._cap(kept, now)
+                    if horizon is not None:
+                        horizons[team_id] = horizon
+                if len(kept) == len(events):
+                    kept = events
+            applied[team_id] = (events, window, kept)
+            evicted += len(events) - len(kept)
+            retained[team_id] = kept
+
+        if evicted:
+            _LOGGER.debug("Evicted %d events outside the retention policy", evicted)
+        self._applied = applied
+        self._evicted = evicted
+        self.horizons = horizons
+        return retained
+
+    def _cap(
+        self, events: list[TeamSnapEvent], now: datetime
+    ) -> tuple[list[TeamSnapEvent], datetime | None]:
+        """Trim events to the cap, preferring upcoming ones."""
+        # Undated events are the first to go
+        ordered = sorted(
+            (event for event in events if event.start is not None),
+            key=lambda event: event.start,  # type: ignore[arg-type,return-value]
+        )
+        upcoming = [
+            event for event in ordered if event.start > now  # type: ignore[operator]
+        ]
+        past = ordered[: len(ordered) - len(upcoming)]
+
+        kept_upcoming = upcoming[: self._max_per_team]
+        room = self._max_per_team - len(kept_upcoming)
+        kept_past = past[len(past) - room :] if room else []
+
+        horizon = None
+        if len(kept_upcoming) < len(upcoming):
+            horizon = kept_upcoming[-1].start
+        return kept_past + kept_upcoming, horizon
+
+    def stats(self, events_by_team: dict[int, list[TeamSnapEvent]]) -> RetentionStats:
+        """Count retained events and estimate their memory footprint.
+
+        The estimate covers the event objects, their string fields and the
+        per-team lists; strings shared between events are counted for each.
+        """
+        count = 0
+        size = sys.getsizeof(events_by_team)
+        for events in events_by_team.values():
+            size += sys.getsizeof(events)
+            for event in events:
+                count += 1
+                size += _event_size(event)
+        return RetentionStats(count, self._evicted, size)
+
+
+def _event_size(event: TeamSnapEvent) -> int:
+    """Estimate the bytes held by one event."""
+    size = sys.getsizeof(event)
+    for value in (event.name, event.location, event.opponent, event.start):
+        if value is not None:
+            size += sys.getsizeof(value)
+    return size
@@ -0,0 +1,96 @@
+"""Adaptive polling schedule for TeamSnap."""
+
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+
+from homeassistant.util import dt as dt_util
+
+from .const import DEFAULT_MAX_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL
+from .timeline import EventTimeline
+
+# How far ahead the next event is -> how often to poll, and why
+_PROXIMITY_TIERS: tuple[tuple[timedelta, timedelta | None, str], ...] = (
+    (timedelta(hours=3), None, "event within 3 hours"),
+    (timedelta(hours=24), timedelta(minutes=15), "event within 24 hours"),
+    (timedelta(days=7), timedelta(hours=1), "event within 7 days"),
+)
+
+# Quiet hours never delay a poll past this long before the next event
+_QUIET_HOURS_LEAD = timedelta(hours=3)
+
+
+class PollScheduler:
+    """Pick the next update interval from how close the next event is.
+
+    Polls run at the minimum interval in the hours before an event and back
+    off towards the maximum when nothing is scheduled for days. During quiet
+    hours polling waits until they end, unless an event is coming up.
+    """
+
+    def __init__(
+        self,
+        min_interval: int = DEFAULT_MIN_UPDATE_INTERVAL,
+        max_interval: int = DEFAULT_MAX_UPDATE_INTERVAL,
+        quiet_start: time | None = None,
+        quiet_end: time | None = None,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._min = timedelta(seconds=min_interval)
+        self._max = timedelta(seconds=max(min_interval, max_interval))
+        self._quiet_start = quiet_start
+        self._quiet_end = quiet_end
+
+    def next_interval(
+        self, timeline: EventTimeline, now: datetime | None = None
+    ) -> tuple[timedelta, str]:
+        """Return the interval until the next poll and the reason for it."""
+        now = now or dt_util.utcnow()
+        next_event = timeline.next_after(now)
+        until_event = next_event.start - now if next_event else None
+
+        interval, reason = self._max, "no upcoming events"
+        if until_event is not None:
+            interval, reason = self._max, "no event within 7 days"
+            for horizon, tier_interval, tier_reason in _PROXIMITY_TIERS:
+                if until_event <= horizon:
+                    interval, reason = tier_interval or self._min, tier_reason
+                    break
+        interval = min(max(interval, self._min), self._max)
+
+        until_quiet_end = self._until_quiet_end(now)
+        if until_quiet_end is not None and (
+            until_event is None or until_event > _QUIET_HOURS_LEAD
+        ):
+            wake = until_quiet_end
+            if until_event is not None:
+                wake = min(wake, until_event - _QUIET_HOURS_LEAD)
+            if wake > interval:
+                interval, reason = wake, "quiet hours"
+
+        return interval, reason
+
+    def _until_quiet_end(self, now: datetime) -> timedelta | None:
+        """Return the time until quiet hours end, or None outside them."""
+        if self._quiet_start is None or self._quiet_end is None:
+            return None
+        if self._quiet_start == self._quiet_end:
+            return None
+
+        local_now = dt_util.as_local(now)
+        current = local_now.time()
+        start, end = self._quiet_start, self._quiet_end
+        if start < end:
+            in_quiet = start <= current < end
+        else:
+            # Window wraps past midnight, e.g. 22:00 - 06:00
+            in_quiet = current >= start or current < end
+        if not in_quiet:
+            return None
+
+        quiet_end = local_now.replace(
+            hour=end.hour, minute=end.minute, second=0, microsecond=0
+        )
+        if quiet_end <= local_now:
+            quiet_end += timedelta(days=1)
+        return quiet_end - local_now
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 
 import logging
@@ -14,24 +16,16 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util
-
-from .const import (
-    ATTR_NEXT_GAME,
-    ATTR_NEXT_GAME_DATE,
-    ATTR_NEXT_GAME_LOCATION,
-    ATTR_NEXT_GAME_OPPONENT,
-    ATTR_NEXT_GAME_TIME,
-    ATTR_NEXT_PRACTICE,
-    ATTR_TEAM_ID,
-    ATTR_TEAM_NAME,
-    ATTR_UPCOMING_EVENTS,
-    DOMAIN,
-)
+
+from .const import DOMAIN
 from .coordinator import TeamSnapDataUpdateCoordinator
+from .metrics import RefreshRecord
+from .view import SensorView
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,6 +52,51 @@ SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class TeamSnapMetricDescription(SensorEntityDescription):
+    """Describes a sensor reporting on the last refresh."""
+
+    value_fn: Callable[[RefreshRecord], float | int]
+
+
+# Off by default; enable them to see where refresh time goes
+METRIC_DESCRIPTIONS: tuple[TeamSnapMetricDescription, ...] = (
+    TeamSnapMetricDescription(
+        key="refresh_duration",
+        name="Refresh Duration",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda record: round(record.duration, 3),
+    ),
+    TeamSnapMetricDescription(
+        key="refresh_requests",
+        name="Refresh Requests",
+        icon="mdi:swap-vertical",
+        native_unit_of_measurement="requests",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda record: record.requests,
+    ),
+    TeamSnapMetricDescription(
+        key="refresh_bytes",
+        name="Refresh Bytes",
+        icon="mdi:download-network",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda record: record.wire_bytes,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -74,13 +113,54 @@ async def async_setup_entry(
 
     coordinator: TeamSnapDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = [
+    entities: list[SensorEntity] = [
         TeamSnapSensor(coordinator, description)
         for description in SENSOR_DESCRIPTIONS
     ]
+    entities.extend(
+        TeamSnapMetricSensor(coordinator, description)
+        for description in METRIC_DESCRIPTIONS
+    )
 
     async_add_entities(entities)
 
+    # Per-team sensor sets follow the team list as it changes
+    team_entities: dict[int, list[TeamSnapTeamSensor]] = {}
+    synced_teams: list[dict[str, Any]] | None = None
+
+    @callback
+    def _async_sync_team_entities() -> None:
+        """Add sensors for new teams and remove those of departed teams."""
+        nonlocal synced_teams
+        teams = coordinator.teams
+        if teams is synced_teams:
+            # The team list is only replaced when it changed
+            return
+        synced_teams = teams
+        teams_by_id = {team["id"]: team for team in teams if team.get("id")}
+
+        ent_reg = er.async_get(hass)
+        for team_id in team_entities.keys() - teams_by_id.keys():
+            for entity in team_entities.pop(team_id):
+                _LOGGER.debug("Removing %s, team %s is gone", entity.entity_id, team_id)
+                if entity.registry_entry is not None:
+                    ent_reg.async_remove(entity.entity_id)
+                else:
+                    hass.async_create_task(entity.async_remove())
+
+        new_entities: list[TeamSnapTeamSensor] = []
+        for team_id in teams_by_id.keys() - team_entities.keys():
+            team_entities[team_id] = [
+                TeamSnapTeamSensor(coordinator, description, teams_by_id[team_id])
+                for description in SENSOR_DESCRIPTIONS
+            ]
+            new_entities.extend(team_entities[team_id])
+        if new_entities:
+            async_add_entities(new_entities)
+
+    _async_sync_team_entities()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync_team_entities))
+
 
 class TeamSnapSensor(CoordinatorEntity[TeamSnapDataUpdateCoordinator], SensorEntity):
     """Representation of a TeamSnap sensor."""
@@ -98,100 +178,133 @@ class TeamSnapSensor(CoordinatorEntity[TeamSnapDataUpdateCoordinator], SensorEnt
         entry_id = getattr(coordinator.config_entry, 'entry_id', 'unknown') if coordinator.config_entry else 'unknown'
         self._attr_unique_id = f"{entry_id}_{description.key}"
         self._attr_name = f"TeamSnap {description.name}"
+        self._written_view: SensorView | None = self._view
+        self._written_available = self.available
 
     @property
-    def native_value(self) -> datetime | int | None:
-        """Return the state of the sensor."""
+    def _view(self) -> SensorView | None:
+        """Return this sensor's slice of the current view model."""
         data = self.coordinator.data
         if not data:
             return None
+        return data.get("sensors", {}).get(self.entity_description.key)
 
-        key = self.entity_description.key
-
-        if key == "next_game":
-            next_game = data.get("next_game")
-            if next_game:
-                start_date = next_game.get("start_date")
-                if start_date:
-                    try:
-                        dt = dt_util.parse_datetime(start_date)
-                        if dt:
-                            return dt_util.as_local(dt)
-                    except (ValueError, TypeError):
-                        pass
-            return None
-
-        if key == "upcoming_events_count":
-            return data.get("upcoming_events_count", 0)
-
-        if key == "next_practice":
-            next_practice = data.get("next_practice")
-            if next_practice:
-                start_date = next_practice.get("start_date")
-                if start_date:
-                    try:
-                        dt = dt_util.parse_datetime(start_date)
-                        if dt:
-                            return dt_util.as_local(dt)
-                    except (ValueError, TypeError):
-                        pass
-            return None
+    @property
+    def available(self) -> bool:
+        """Return whether the sensor has fresh or restored data to show."""
+        return super().available or self.coordinator.serving_snapshot
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this sensor's view or availability changed."""
+        view = self._view
+        available = self.available
+        if view == self._written_view and available == self._written_available:
+            return
+        self._written_view = view
+        self._written_available = available
+        self.async_write_ha_state()
 
-        return None
+    @property
+    def native_value(self) -> datetime | int | None:
+        """Return the state of the sensor."""
+        view = self._view
+        return view.value if view else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
+        view = self._view
+        return view.attributes if view else {}
+
+
+class TeamSnapTeamSensor(TeamSnapSensor):
+    """A TeamSnap sensor covering one team's events."""
+
+    def __init__(
+        self,
+        coordinator: TeamSnapDataUpdateCoordinator,
+        description: SensorEntityDescription,
+        team: dict[str, Any],
+    ) -> None:
+        """Initialize the sensor."""
+        self._team_id: int = team["id"]
+        super().__init__(coordinator, description)
+        self._attr_unique_id = f"{self._attr_unique_id}_{self._team_id}"
+        self._attr_name = (
+            f"TeamSnap {team.get('name') or self._team_id} {description.name}"
+        )
+
+    @property
+    def _view(self) -> SensorView | None:
+        """Return this sensor's slice of its team's views."""
         data = self.coordinator.data
         if not data:
-            return {}
+            return None
+        team_views = data.get("team_sensors", {}).get(self._team_id)
+        return team_views.get(self.entity_description.key) if team_views else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Skip the view lookup entirely when this team did not change."""
+        data = self.coordinator.data or {}
+        if (
+            self._team_id not in data.get("changed_teams", ())
+            and self.available == self._written_available
+        ):
+            return
+        super()._handle_coordinator_update()
 
-        attrs: dict[str, Any] = {}
-
-        # Add next game attributes
-        next_game = data.get("next_game")
-        if next_game:
-            attrs[ATTR_NEXT_GAME] = next_game.get("name", "Unknown")
-            start_date = next_game.get("start_date")
-            if start_date:
-                try:
-                    dt = dt_util.parse_datetime(start_date)
-                    if dt:
-                        attrs[ATTR_NEXT_GAME_DATE] = dt.strftime("%Y-%m-%d")
-                        attrs[ATTR_NEXT_GAME_TIME] = dt.strftime("%H:%M")
-                except (ValueError, TypeError):
-                    pass
-            attrs[ATTR_NEXT_GAME_LOCATION] = next_game.get("location_name", "Unknown")
-            attrs[ATTR_NEXT_GAME_OPPONENT] = next_game.get("opponent_name", "Unknown")
-            attrs[ATTR_TEAM_ID] = next_game.get("team_id")
-
-        # Add next practice attributes
-        next_practice = data.get("next_practice")
-        if next_practice:
-            attrs[ATTR_NEXT_PRACTICE] = next_practice.get("name", "Unknown")
-            attrs[ATTR_TEAM_ID] = next_practice.get("team_id")
-
-        # Add team information
-        teams = data.get("teams", [])
-        if teams:
-            # Use the first team or the team from next_game/next_practice
-            team_id = attrs.get(ATTR_TEAM_ID)
-            team = None
-
-            if team_id:
-                # Find team by ID
-                team = next(
-                    (t for t in teams if t and t.get("id") == team_id),
-                    None,
-                )
-
-            # Fallback to first team if no specific team found
-            if not team and teams:
-                team = teams[0]
-
-            if team and isinstance(team, dict):
-                attrs[ATTR_TEAM_NAME] = team.get("name", "Unknown")
-
-        attrs[ATTR_UPCOMING_EVENTS] = data.get("upcoming_events_count", 0)
-
-        return attrs
+
+class TeamSnapMetricSensor(
+    CoordinatorEntity[TeamSnapDataUpdateCoordinator], SensorEntity
+):
+    """A diagnostic sensor reporting on the last refresh."""
+
+    entity_description: TeamSnapMetricDescription
+
+    def __init__(
+        self,
+        coordinator: TeamSnapDataUpdateCoordinator,
+        description: TeamSnapMetricDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        entry_id = (
+            coordinator.config_entry.entry_id
+            if coordinator.config_entry
+            else "unknown"
+        )
+        self._attr_unique_id = f"{entry_id}_{description.key}"
+        self._attr_name = f"TeamSnap {description.name}"
+
+    @property
+    def available(self) -> bool:
+        """Return whether a refresh has been measured yet."""
+        return self.coordinator.api_client.metrics.last_refresh is not None
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the measurement of the last refresh."""
+        record = self.coordinator.api_client.metrics.last_refresh
+        return self.entity_description.value_fn(record) if record else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the breakdown of the last refresh's measurement."""
+        record = self.coordinator.api_client.metrics.last_refresh
+        if record is None:
+            return {}
+        if self.entity_description.key == "refresh_bytes":
+            return {"decoded": record.bytes}
+        if self.entity_description.key != "refresh_duration":
+            return {}
+        return {
+            "network": round(record.network, 3),
+            "decode": round(record.decode, 3),
+            "offloaded": round(record.offloaded, 3),
+            "index": round(record.index_time, 3),
+            "views": round(record.views_time, 3),
+            "success": record.success,
+        }
@@ -0,0 +1,166 @@
+"""Services for the TeamSnap integration."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import logging
+import pstats
+import time
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_DATE,
+    ATTR_ENTRY_ID,
+    ATTR_LIMIT,
+    ATTR_SORT,
+    ATTR_TEAM_ID,
+    DATA_REGISTRY,
+    DEFAULT_PROFILE_LIMIT,
+    DOMAIN,
+    PROFILE_SCOPE,
+    PROFILE_SORT_KEYS,
+    SERVICE_PROFILE_REFRESH,
+    SERVICE_REFRESH,
+)
+from .coordinator import TeamSnapDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Only one profiler can be enabled per thread, so calls never overlap
+_PROFILE_LOCK = asyncio.Lock()
+
+REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_TEAM_ID): vol.All(cv.ensure_list, [vol.Coerce(int)]),
+        vol.Optional(ATTR_DATE): vol.All(cv.ensure_list, [cv.date]),
+    }
+)
+
+PROFILE_REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_SORT, default=PROFILE_SORT_KEYS[0]): vol.In(
+            PROFILE_SORT_KEYS
+        ),
+        vol.Optional(ATTR_LIMIT, default=DEFAULT_PROFILE_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the TeamSnap services."""
+    if hass.services.has_service(DOMAIN, SERVICE_REFRESH):
+        return
+
+    async def _async_refresh(call: ServiceCall) -> None:
+        """Queue a refresh of some teams, merged with other recent calls."""
+        for coordinator in _coordinators(hass, call.data.get(ATTR_ENTRY_ID)):
+            # Each entry only refreshes the teams it can see
+            await coordinator.async_request_team_refresh(
+                call.data.get(ATTR_TEAM_ID), call.data.get(ATTR_DATE)
+            )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REFRESH, _async_refresh, schema=REFRESH_SCHEMA
+    )
+
+    async def _async_profile_refresh(call: ServiceCall) -> ServiceResponse:
+        """Run one refresh under the profiler and write the results."""
+        coordinators = _coordinators(hass, call.data.get(ATTR_ENTRY_ID))
+        if _PROFILE_LOCK.locked():
+            raise ServiceValidationError("A profile is already running")
+
+        async with _PROFILE_LOCK:
+            base = hass.config.path(
+                f"{DOMAIN}_profile_{dt_util.utcnow():%Y%m%dT%H%M%S}"
+            )
+            # Nothing is hooked in until the service runs
+            profiler = cProfile.Profile()
+            start = time.perf_counter()
+            try:
+                profiler.enable()
+            except ValueError as err:
+                # Another profiler, such as Home Assistant's, is active
+                raise ServiceValidationError(
+                    "A profile is already running"
+                ) from err
+            try:
+                for coordinator in coordinators:
+                    await coordinator.async_refresh()
+            finally:
+                profiler.disable()
+            duration = time.perf_counter() - start
+
+        await hass.async_add_executor_job(
+            _write_profile,
+            profiler,
+            base,
+            call.data[ATTR_SORT],
+            call.data[ATTR_LIMIT],
+        )
+        _LOGGER.info(
+            "Profiled a %.2fs refresh, report written to %s.txt", duration, base
+        )
+        return {
+            "duration": round(duration, 3),
+            "report": f"{base}.txt",
+            "stats": f"{base}.prof",
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_REFRESH,
+        _async_profile_refresh,
+        schema=PROFILE_REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def _coordinators(
+    hass: HomeAssistant, entry_id: str | None
+) -> list[TeamSnapDataUpdateCoordinator]:
+    """Return the coordinator of one entry, or of every loaded entry."""
+    loaded = {
+        key: coordinator
+        for key, coordinator in hass.data.get(DOMAIN, {}).items()
+        if key != DATA_REGISTRY
+    }
+    if entry_id is None:
+        if not loaded:
+            raise ServiceValidationError("No TeamSnap entry is loaded")
+        return list(loaded.values())
+    if entry_id not in loaded:
+        raise ServiceValidationError(f"TeamSnap entry {entry_id} is not loaded")
+    return [loaded[entry_id]]
+
+
+def _write_profile(
+    profiler: cProfile.Profile, base: str, sort: str, limit: int
+) -> None:
+    """Write a loadable stats file and a report of the TeamSnap functions.
+
+    The profiler sees everything the event loop ran during the refresh;
+    the report keeps to this integration's code, while the ``.prof`` file
+    keeps it all for tools such as ``pstats`` or snakeviz.
+    """
+    profiler.dump_stats(f"{base}.prof")
+    with open(f"{base}.txt", "w", encoding="utf-8") as report:
+        stats = pstats.Stats(profiler, stream=report)
+        stats.sort_stats(sort).print_stats(PROFILE_SCOPE, limit)
@@ -0,0 +1,122 @@
+"""State shared by every TeamSnap config entry."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.config_entry_oauth2_flow import OAuth2Session
+
+from .api import TeamSnapAPIClient
+from .cache import ResponseCache
+from .const import DATA_REGISTRY, DOMAIN, SHARED_EVENTS_MAX_AGE
+from .discovery import TeamSnapDiscovery
+from .models import TeamSnapEvent
+from .ratelimit import CircuitBreaker, TokenBucket
+
+
+class TeamSnapRegistry:
+    """Domain-wide client state and per-team event results.
+
+    Every entry's API client shares one response cache, rate limiter, set
+    of circuit breakers and discovered API root; requests still go through
+    HA's shared aiohttp session with each entry's own OAuth token. Only
+    team-scoped pages are shared through the cache; account-scoped ones
+    such as /me and /teams are cached under each entry's id. Per-team
+    event results are shared too: a team fetched recently by one entry is
+    reused by the others, and a team currently being fetched is awaited
+    instead of being requested again (single-flight).
+    """
+
+    def __init__(
+        self,
+        max_age: float = SHARED_EVENTS_MAX_AGE,
+        discovery: TeamSnapDiscovery | None = None,
+    ) -> None:
+        """Initialize the registry."""
+        self.cache = ResponseCache()
+        self.discovery = discovery or TeamSnapDiscovery()
+        self.rate_limiter = TokenBucket()
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self._max_age = max_age
+        self._team_events: dict[int, tuple[float, list[TeamSnapEvent]]] = {}
+        self._inflight: dict[int, asyncio.Future[list[TeamSnapEvent] | None]] = {}
+
+    def create_client(self, session: OAuth2Session) -> TeamSnapAPIClient:
+        """Create an API client for one entry's OAuth session."""
+        return TeamSnapAPIClient(
+            session,
+            cache=self.cache,
+            rate_limiter=self.rate_limiter,
+            breakers=self.breakers,
+            discovery=self.discovery,
+            cache_scope=session.config_entry.entry_id,
+        )
+
+    def claim_teams(
+        self, team_ids: list[int]
+    ) -> tuple[
+        dict[int, list[TeamSnapEvent]],
+        dict[int, asyncio.Future[list[TeamSnapEvent] | None]],
+        list[int],
+    ]:
+        """Split teams into fresh shared results, fetches to await, and teams
+        the caller must fetch itself.
+
+        The caller must pass every claimed team to ``publish`` afterwards,
+        whether or not its fetch succeeded.
+        """
+        now = time.monotonic()
+        fresh: dict[int, list[TeamSnapEvent]] = {}
+        waiting: dict[int, asyncio.Future[list[TeamSnapEvent] | None]] = {}
+        claimed: list[int] = []
+
+        for team_id in team_ids:
+            shared = self._team_events.get(team_id)
+            if shared is not None and now - shared[0] < self._max_age:
+                fresh[team_id] = shared[1]
+            elif team_id in self._inflight:
+                waiting[team_id] = self._inflight[team_id]
+            else:
+                self._inflight[team_id] = asyncio.get_running_loop().create_future()
+                claimed.append(team_id)
+
+        return fresh, waiting, claimed
+
+    def publish(
+        self,
+        claimed: list[int],
+        results: dict[int, list[TeamSnapEvent]],
+    ) -> None:
+        """Share the results of claimed teams and release anyone waiting.
+
+        Claimed teams missing from ``results`` resolve to None so waiters
+        fall back to their own cached events.
+        """
+        now = time.monotonic()
+        for team_id in claimed:
+            events = results.get(team_id)
+            if events is not None:
+                self._team_events[team_id] = (now, events)
+            future = self._inflight.pop(team_id, None)
+            if future is not None and not future.done():
+                future.set_result(events)
+
+        # Results past their useful age are not kept around
+        for team_id in [
+            team_id
+            for team_id, (fetched_at, _) in self._team_events.items()
+            if now - fetched_at >= self._max_age
+        ]:
+            del self._team_events[team_id]
+
+
+def async_get_registry(hass: HomeAssistant) -> TeamSnapRegistry:
+    """Return the domain-wide registry, creating it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_REGISTRY not in domain_data:
+        domain_data[DATA_REGISTRY] = TeamSnapRegistry(
+            discovery=TeamSnapDiscovery(hass)
+        )
+    return domain_data[DATA_REGISTRY]
@@ -0,0 +1,113 @@
+"""Persistent snapshot of TeamSnap data."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY, STORAGE_VERSION
+from .models import EventKind, TeamSnapEvent
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TeamSnapSnapshotStore:
+    """Save the last good teams and events so entities have state at startup.
+
+    Events are stored per team as compact rows of
+    ``[id, name, start timestamp, kind, location, opponent, duration]``.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the snapshot store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}", private=True
+        )
+        self._teams: list[dict[str, Any]] = []
+        self._events: dict[int, list[TeamSnapEvent]] = {}
+        self._save_pending = False
+
+    async def async_load(
+        self,
+    ) -> tuple[list[dict[str, Any]], dict[int, list[TeamSnapEvent]]] | None:
+        """Load the saved teams and events, if there are any."""
+        try:
+            data = await self._store.async_load()
+        except Exception as err:  # A corrupt snapshot must not block setup
+            _LOGGER.warning("Failed to load TeamSnap snapshot: %s", err)
+            return None
+        if not data:
+            return None
+
+        events_by_team: dict[int, list[TeamSnapEvent]] = {}
+        for team_id, rows in data.get("events", {}).items():
+            team = int(team_id)
+            events_by_team[team] = [_event_from_row(row, team) for row in rows]
+        return data.get("teams", []), events_by_team
+
+    @callback
+    def async_schedule_save(
+        self,
+        teams: list[dict[str, Any]],
+        events_by_team: dict[int, list[TeamSnapEvent]],
+    ) -> None:
+        """Save a snapshot after a delay, coalescing saves in between."""
+        self._teams = teams
+        self._events = events_by_team
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write a scheduled snapshot now, cancelling the delayed save."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the saved snapshot."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the snapshot in its stored form."""
+        self._save_pending = False
+        return {
+            "teams": self._teams,
+            "events": {
+                str(team_id): [_event_to_row(event) for event in events]
+                for team_id, events in self._events.items()
+            },
+        }
+
+
+def _event_to_row(event: TeamSnapEvent) -> list[Any]:
+    """Convert an event to a compact stored row."""
+    return [
+        event.id,
+        event.name,
+        int(event.start.timestamp()) if event.start else None,
+        event.kind.value,
+        event.location,
+        event.opponent,
+        event.duration,
+    ]
+
+
+def _event_from_row(row: list[Any], team_id: int) -> TeamSnapEvent:
+    """Restore an event from a compact stored row."""
+    event_id, name, start, kind, location, opponent = row[:6]
+    # Snapshots saved before durations were kept have six columns
+    duration = row[6] if len(row) > 6 else None
+    return TeamSnapEvent(
+        id=event_id,
+        team_id=team_id,
+        name=name,
+        start=dt_util.utc_from_timestamp(start) if start is not None else None,
+        kind=EventKind(kind),
+        location=location,
+        opponent=opponent,
+        duration=duration,
+    )
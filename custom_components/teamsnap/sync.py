@@ -0,0 +1,285 @@
+"""Incremental, date-windowed event sync for TeamSnap."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
+import logging
+
+from homeassistant.util import dt as dt_util
+
+from .api import TeamSnapAPIClient
+from .const import (
+    DEFAULT_FETCH_CONCURRENCY,
+    DEFAULT_FULL_SYNC_INTERVAL,
+    DEFAULT_SYNC_FUTURE_DAYS,
+    DEFAULT_SYNC_PAST_DAYS,
+)
+from .models import TeamSnapEvent
+
+_LOGGER = logging.getLogger(__name__)
+
+# Overlap applied to updated_since so clock skew cannot drop a change
+SYNC_OVERLAP = timedelta(minutes=1)
+
+
+class TeamSnapEventSync:
+    """Keep per-team event sets current by fetching only what changed.
+
+    The first sync of a team (and every full sync interval after that)
+    downloads the rolling window. In between, only events updated since the
+    previous sync are requested and merged into the cached set by id.
+    """
+
+    def __init__(
+        self,
+        api_client: TeamSnapAPIClient,
+        past_days: int = DEFAULT_SYNC_PAST_DAYS,
+        future_days: int = DEFAULT_SYNC_FUTURE_DAYS,
+        full_sync_interval: int = DEFAULT_FULL_SYNC_INTERVAL,
+    ) -> None:
+        """Initialize the event sync."""
+        self._api_client = api_client
+        self._past = timedelta(days=past_days)
+        self._future = timedelta(days=future_days)
+        self._full_sync_interval = timedelta(seconds=full_sync_interval)
+        self._last_sync: dict[int, datetime] = {}
+        self._last_full_sync: dict[int, datetime] = {}
+
+    def window(self, now: datetime | None = None) -> tuple[datetime, datetime]:
+        """Return the start and end of the current sync window.
+
+        Bounds are aligned to UTC midnight so repeated full syncs on the same
+        day send identical URLs and can be answered from the response cache.
+        """
+        now = now or dt_util.utcnow()
+        day = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return day - self._past, day + self._future + timedelta(days=1)
+
+    async def async_sync_team(
+        self,
+        team_id: int,
+        cached: list[TeamSnapEvent] | None,
+    ) -> list[TeamSnapEvent]:
+        """Return the team's events in the window, merging in any changes."""
+        now = dt_util.utcnow()
+        window_start, window_end = self.window(now)
+
+        if self._needs_full_sync(team_id, cached, now):
+            events = [
+                event
+                async for event in self._api_client.async_iter_team_events(
+                    team_id, started_after=window_start, started_before=window_end
+                )
+            ]
+            return self._apply_full_sync(team_id, events, cached, now)
+
+        # Deltas are not date-filtered so events moved out of the window are
+        # seen and pruned
+        changes = self._api_client.async_iter_team_events(
+            team_id, updated_since=self._last_sync[team_id] - SYNC_OVERLAP
+        )
+        merged = {event.id: event for event in cached or []}
+        count = 0
+        async for event in changes:
+            merged[event.id] = event
+            count += 1
+        return self._apply_delta_sync(team_id, merged, count, cached, now)
+
+    async def async_sync_teams(
+        self,
+        cached: dict[int, list[TeamSnapEvent]],
+        team_ids: list[int],
+        concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+    ) -> dict[int, list[TeamSnapEvent]]:
+        """Sync several teams through batched event searches.
+
+        Teams due a full sync share one windowed search and the rest share
+        one updated-since search. Teams whose search failed are left out of
+        the result.
+        """
+        now = dt_util.utcnow()
+        window_start, window_end = self.window(now)
+        full: list[int] = []
+        delta: list[int] = []
+        for team_id in team_ids:
+            if self._needs_full_sync(team_id, cached.get(team_id), now):
+                full.append(team_id)
+            else:
+                delta.append(team_id)
+        results: dict[int, list[TeamSnapEvent]] = {}
+
+        if full:
+            buckets = await self._api_client.async_search_events(
+                full,
+                started_after=window_start,
+                started_before=window_end,
+                concurrency=concurrency,
+            )
+            for team_id, events in buckets.items():
+                results[team_id] = self._apply_full_sync(
+                    team_id, events, cached.get(team_id), now
+                )
+
+        if delta:
+            # One cutoff for the whole batch; re-merging a change is harmless
+            since = min(self._last_sync[t] for t in delta) - SYNC_OVERLAP
+            buckets = await self._api_client.async_search_events(
+                delta, updated_since=since, concurrency=concurrency
+            )
+            for team_id, changes in buckets.items():
+                team_cached = cached.get(team_id)
+                merged = {event.id: event for event in team_cached or []}
+                for event in changes:
+                    merged[event.id] = event
+                results[team_id] = self._apply_delta_sync(
+                    team_id, merged, len(changes), team_cached, now
+                )
+
+        return results
+
+    async def async_sync_ranges(
+        self,
+        cached: dict[int, list[TeamSnapEvent]],
+        team_ids: list[int],
+        ranges: list[tuple[datetime, datetime]],
+        concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+    ) -> dict[int, list[TeamSnapEvent]]:
+        """Refetch some teams' events starting within date ranges.
+
+        Each team's cached events in a range are replaced by what the search
+        returns, so events cancelled or moved away are dropped; where they
+        moved to is picked up by the next delta sync. Events moved into a
+        range lose their cached copy from outside it. The sync schedule is
+        left alone. Teams whose search failed are left out of the result.
+        """
+        window_start, window_end = self.window()
+        results = {team_id: cached[team_id] for team_id in team_ids}
+
+        for range_start, range_end in ranges:
+            start, end = max(range_start, window_start), min(range_end, window_end)
+            if start >= end or not results:
+                continue
+            buckets = await self._api_client.async_search_events(
+                list(results),
+                started_after=start,
+                started_before=end,
+                concurrency=concurrency,
+            )
+            for team_id in list(results):
+                if team_id not in buckets:
+                    del results[team_id]
+                    continue
+                events = results[team_id]
+                fetched = [
+                    event
+                    for event in buckets[team_id]
+                    if event.start is not None and start <= event.start < end
+                ]
+                fetched_ids = {event.id for event in fetched}
+                kept: list[TeamSnapEvent] = []
+                replaced: list[TeamSnapEvent] = []
+                moved_in = False
+                for event in events:
+                    if event.start is not None and start <= event.start < end:
+                        replaced.append(event)
+                    elif event.id in fetched_ids:
+                        # Moved into the range; the fetched copy replaces it
+                        moved_in = True
+                    else:
+                        kept.append(event)
+                # Replayed from the response cache, nothing changed
+                if moved_in or not _same_events(fetched, replaced):
+                    results[team_id] = kept + fetched
+
+        _LOGGER.debug(
+            "Range sync of teams %s over %d ranges", sorted(results), len(ranges)
+        )
+        return results
+
+    def invalidate(self, team_ids: Iterable[int]) -> None:
+        """Make the next sync of some teams download their whole window."""
+        for team_id in team_ids:
+            self._last_full_sync.pop(team_id, None)
+
+    def _needs_full_sync(
+        self, team_id: int, cached: list[TeamSnapEvent] | None, now: datetime
+    ) -> bool:
+        """Return whether a team must download its whole window."""
+        last_full_sync = self._last_full_sync.get(team_id)
+        return (
+            cached is None
+            or team_id not in self._last_sync
+            or last_full_sync is None
+            or now - last_full_sync >= self._full_sync_interval
+        )
+
+    def _apply_full_sync(
+        self,
+        team_id: int,
+        events: list[TeamSnapEvent],
+        cached: list[TeamSnapEvent] | None,
+        now: datetime,
+    ) -> list[TeamSnapEvent]:
+        """Record a full window download, which also drops deleted events."""
+        self._last_full_sync[team_id] = now
+        self._last_sync[team_id] = now
+        if cached is not None and _same_events(events, cached):
+            # Served from the response cache, nothing to recompute
+            events = cached
+        _LOGGER.debug("Full sync of team %s: %d events", team_id, len(events))
+        return _prune_events(events, *self.window(now))
+
+    def _apply_delta_sync(
+        self,
+        team_id: int,
+        merged: dict[int | None, TeamSnapEvent],
+        changes: int,
+        cached: list[TeamSnapEvent] | None,
+        now: datetime,
+    ) -> list[TeamSnapEvent]:
+        """Record a delta download merged into the cached events by id."""
+        self._last_sync[team_id] = now
+        events = list(merged.values()) if changes or cached is None else cached
+        _LOGGER.debug("Delta sync of team %s: %d changes", team_id, changes)
+        return _prune_events(events, *self.window(now))
+
+    def forget_team(self, team_id: int) -> None:
+        """Drop sync state for a team that is no longer present."""
+        self._last_sync.pop(team_id, None)
+        self._last_full_sync.pop(team_id, None)
+
+
+def _prune_events(
+    events: list[TeamSnapEvent], window_start: datetime, window_end: datetime
+) -> list[TeamSnapEvent]:
+    """Drop events that start outside the sync window.
+
+    The list is returned unchanged (the same object) when nothing is dropped.
+    """
+    kept = [
+        event
+        for event in events
+        if event.start is None or window_start <= event.start <= window_end
+    ]
+    return events if len(kept) == len(events) else kept
+
+
+def _same_events(events: list[TeamSnapEvent], cached: list[TeamSnapEvent]) -> bool:
+    """Return whether two event lists hold the very same records."""
+    return len(events) == len(cached) and all(
+        event is other for event, other in zip(events, cached, strict=True)
+    )
+
+
+def day_ranges(days: Iterable[date]) -> list[tuple[datetime, datetime]]:
+    """Return the local-time spans of some days, with consecutive days joined."""
+    ranges: list[tuple[datetime, datetime]] = []
+    for day in sorted(set(days)):
+        start = dt_util.start_of_local_day(day)
+        end = dt_util.start_of_local_day(day + timedelta(days=1))
+        if ranges and ranges[-1][1] == start:
+            ranges[-1] = (ranges[-1][0], end)
+        else:
+            ranges.append((start, end))
+    return ranges
@@ -0,0 +1,150 @@
+"""Sorted event timeline for TeamSnap."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Collection
+from datetime import datetime, timedelta
+
+from .models import EventKind, TeamSnapEvent
+
+VIEW_ALL = "all"
+VIEW_GAMES = "games"
+VIEW_PRACTICES = "practices"
+
+
+class _TimelineView:
+    """Events of one kind in start-time order."""
+
+    __slots__ = ("starts", "events", "longest")
+
+    def __init__(self, events: list[TeamSnapEvent]) -> None:
+        """Initialize the view from events already sorted by start time."""
+        self.events = events
+        self.starts: list[datetime] = [event.start for event in events]
+        # Bounds how far before a range an overlapping event can start
+        self.longest = max((event.length for event in events), default=timedelta())
+
+
+class EventTimeline:
+    """Index of every team's events in start-time order.
+
+    Each view keeps a parallel list of start times so "next after" and
+    "count after" lookups are a bisect instead of a scan. Events without a
+    start time are left out.
+    """
+
+    def __init__(self, events_by_team: dict[int, list[TeamSnapEvent]]) -> None:
+        """Build the timeline from events grouped by team."""
+        events = sorted(
+            (
+                event
+                for team_events in events_by_team.values()
+                for event in team_events
+                if event.start is not None
+            ),
+            key=_start,
+        )
+        self._index(events)
+
+    def replace_teams(
+        self,
+        events_by_team: dict[int, list[TeamSnapEvent]],
+        team_ids: Collection[int],
+    ) -> EventTimeline:
+        """Return a new timeline with only some teams' events swapped in.
+
+        The other teams' events stay one ordered run, which ``sort`` only
+        has to merge with the swapped-in events.
+        """
+        events = [
+            event
+            for event in self._views[VIEW_ALL].events
+            if event.team_id not in team_ids
+        ]
+        events.extend(
+            event
+            for team_id in team_ids
+            for event in events_by_team.get(team_id, ())
+            if event.start is not None
+        )
+        events.sort(key=_start)
+        timeline = EventTimeline.__new__(EventTimeline)
+        timeline._index(events)
+        return timeline
+
+    def _index(self, events: list[TeamSnapEvent]) -> None:
+        """Build the views from every event in start-time order."""
+        # Splitting the sorted list keeps each view sorted
+        games = [event for event in events if event.kind is EventKind.GAME]
+        practices = [event for event in events if event.kind is EventKind.PRACTICE]
+
+        self._views = {
+            VIEW_ALL: _TimelineView(events),
+            VIEW_GAMES: _TimelineView(games),
+            VIEW_PRACTICES: _TimelineView(practices),
+        }
+
+    def next_after(
+        self, when: datetime, view: str = VIEW_ALL
+    ) -> TeamSnapEvent | None:
+        """Return the first event starting strictly after a time."""
+        timeline = self._views[view]
+        index = bisect_right(timeline.starts, when)
+        if index < len(timeline.events):
+            return timeline.events[index]
+        return None
+
+    def count_after(self, when: datetime, view: str = VIEW_ALL) -> int:
+        """Return how many events start strictly after a time."""
+        timeline = self._views[view]
+        return len(timeline.starts) - bisect_right(timeline.starts, when)
+
+    def between(
+        self, start: datetime, end: datetime, view: str = VIEW_ALL
+    ) -> list[TeamSnapEvent]:
+        """Return events starting in [start, end), in start-time order."""
+        timeline = self._views[view]
+        low = bisect_left(timeline.starts, start)
+        high = bisect_left(timeline.starts, end, lo=low)
+        return timeline.events[low:high]
+
+    def overlapping(
+        self, start: datetime, end: datetime, view: str = VIEW_ALL
+    ) -> list[TeamSnapEvent]:
+        """Return events that overlap [start, end), in start-time order.
+
+        Only events starting at most the longest event length before
+        ``start`` can still be running at ``start``, so the scan is limited
+        to that slice of the timeline.
+        """
+        timeline = self._views[view]
+        low = bisect_right(timeline.starts, start - timeline.longest)
+        high = bisect_left(timeline.starts, end, lo=low)
+        return [
+            event
+            for event in timeline.events[low:high]
+            if event.end > start  # type: ignore[operator]
+        ]
+
+    def current_or_next(
+        self, when: datetime, view: str = VIEW_ALL
+    ) -> TeamSnapEvent | None:
+        """Return the earliest event still running at a time, or the next one."""
+        timeline = self._views[view]
+        events = timeline.events
+        for index in range(
+            bisect_right(timeline.starts, when - timeline.longest), len(events)
+        ):
+            if events[index].end > when:  # type: ignore[operator]
+                return events[index]
+        return None
+
+    def __len__(self) -> int:
+        """Return the number of indexed events."""
+        return len(self._views[VIEW_ALL].events)
+
+
+def _start(event: TeamSnapEvent) -> datetime:
+    """Return the sort key of an event with a start time."""
+    return event.start  # type: ignore[return-value]
@@ -0,0 +1,222 @@
+"""Per-refresh view model for TeamSnap entities."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_NEXT_GAME,
+    ATTR_NEXT_GAME_AVAILABILITY,
+    ATTR_NEXT_GAME_DATE,
+    ATTR_NEXT_GAME_LOCATION,
+    ATTR_NEXT_GAME_OPPONENT,
+    ATTR_NEXT_GAME_TIME,
+    ATTR_NEXT_PRACTICE,
+    ATTR_NEXT_PRACTICE_AVAILABILITY,
+    ATTR_TEAM_ID,
+    ATTR_TEAM_NAME,
+    ATTR_UPCOMING_EVENTS,
+)
+from .models import AvailabilitySummary, TeamSnapEvent
+from .timeline import VIEW_GAMES, VIEW_PRACTICES, EventTimeline
+
+
+class SensorView(NamedTuple):
+    """The state and attributes one sensor should show."""
+
+    value: datetime | int | None
+    attributes: dict[str, Any]
+
+
+def build_sensor_views(data: dict[str, Any]) -> dict[str, SensorView]:
+    """Build every account-wide sensor's view from one refresh's data."""
+    teams: list[dict[str, Any]] = data.get("teams", [])
+    # Only a single-team account can name its team without an event to go by
+    default_team = teams[0] if len(teams) == 1 else None
+    return _build_views(
+        data.get("next_game"),
+        data.get("next_practice"),
+        data.get("upcoming_events_count", 0),
+        data["teams_by_id"],
+        default_team,
+        data.get("availability", {}),
+    )
+
+
+class _TeamViews:
+    """One team's timeline and sensor views."""
+
+    __slots__ = ("team", "events", "timeline", "views", "valid_until")
+
+    def __init__(
+        self,
+        team: dict[str, Any],
+        events: list[TeamSnapEvent],
+        timeline: EventTimeline,
+    ) -> None:
+        """Initialize the entry; views are filled in by the index."""
+        self.team = team
+        self.events = events
+        self.timeline = timeline
+        self.views: dict[str, SensorView] = {}
+        self.valid_until: datetime | None = None
+
+
+class TeamSensorIndex:
+    """Sensor views per team, recomputed only for teams that changed.
+
+    A team's views are rebuilt when its team record or event list is a new
+    object, when the caller marks its availability as changed, or once its
+    next event has started (which moves its next game, next practice or
+    upcoming count). Every other team keeps the very same view objects, so
+    per-refresh work grows with the number of changed teams rather than
+    with every team's entities.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._teams: dict[int, _TeamViews] = {}
+        self._availability: dict[int, AvailabilitySummary] = {}
+        self.views: dict[int, dict[str, SensorView]] = {}
+
+    def update(
+        self,
+        teams_by_id: dict[int, dict[str, Any]],
+        events_by_team: dict[int, list[TeamSnapEvent]],
+        now: datetime,
+        availability: dict[int, AvailabilitySummary] | None = None,
+        availability_changed: set[int] | None = None,
+    ) -> set[int]:
+        """Bring the index up to date and return the ids of changed teams.
+
+        ``availability_changed`` names the teams whose events' availability
+        differs from the last update.
+        """
+        changed: set[int] = set()
+        if availability is not None:
+            self._availability = availability
+        availability_changed = availability_changed or set()
+
+        for team_id in self._teams.keys() - teams_by_id.keys():
+            del self._teams[team_id]
+            del self.views[team_id]
+            changed.add(team_id)
+
+        for team_id, team in teams_by_id.items():
+            events = events_by_team.get(team_id, [])
+            entry = self._teams.get(team_id)
+            if entry is None:
+                entry = _TeamViews(team, events, EventTimeline({team_id: events}))
+                self._teams[team_id] = entry
+            elif entry.events is not events:
+                entry.events = events
+                entry.timeline = EventTimeline({team_id: events})
+                entry.team = team
+            elif entry.team is not team:
+                entry.team = team
+            elif team_id not in availability_changed and (
+                entry.valid_until is None or now < entry.valid_until
+            ):
+                continue
+
+            views = self._team_views(team_id, entry, now, self._availability)
+            if views != entry.views:
+                entry.views = views
+                self.views[team_id] = views
+                changed.add(team_id)
+
+        return changed
+
+    @staticmethod
+    def _team_views(
+        team_id: int,
+        entry: _TeamViews,
+        now: datetime,
+        availability: dict[int, AvailabilitySummary],
+    ) -> dict[str, SensorView]:
+        """Build one team's views and note when they next go stale."""
+        timeline = entry.timeline
+        next_event = timeline.next_after(now)
+        entry.valid_until = next_event.start if next_event else None
+        views = _build_views(
+            timeline.next_after(now, VIEW_GAMES),
+            timeline.next_after(now, VIEW_PRACTICES),
+            timeline.count_after(now),
+            {team_id: entry.team},
+            entry.team,
+            availability,
+        )
+        # The three views share one attribute dict; name the team even
+        # when it has nothing scheduled
+        views["next_game"].attributes.setdefault(ATTR_TEAM_ID, team_id)
+        return views
+
+
+def _build_views(
+    next_game: TeamSnapEvent | None,
+    next_practice: TeamSnapEvent | None,
+    upcoming: int,
+    teams_by_id: dict[int, dict[str, Any]],
+    default_team: dict[str, Any] | None,
+    availability: dict[int, AvailabilitySummary],
+) -> dict[str, SensorView]:
+    """Build the views of one next game / upcoming count / next practice set."""
+    attrs = _summary_attributes(
+        next_game, next_practice, upcoming, teams_by_id, default_team, availability
+    )
+
+    return {
+        "next_game": SensorView(_local_start(next_game), attrs),
+        "upcoming_events_count": SensorView(upcoming, attrs),
+        "next_practice": SensorView(_local_start(next_practice), attrs),
+    }
+
+
+def _local_start(event: TeamSnapEvent | None) -> datetime | None:
+    """Return an event's start in local time."""
+    if event and event.start:
+        return dt_util.as_local(event.start)
+    return None
+
+
+def _summary_attributes(
+    next_game: TeamSnapEvent | None,
+    next_practice: TeamSnapEvent | None,
+    upcoming: int,
+    teams_by_id: dict[int, dict[str, Any]],
+    default_team: dict[str, Any] | None,
+    availability: dict[int, AvailabilitySummary],
+) -> dict[str, Any]:
+    """Return the attributes shared by one set of sensors."""
+    attrs: dict[str, Any] = {}
+
+    # Add next game attributes
+    if next_game:
+        attrs[ATTR_NEXT_GAME] = next_game.name or "Unknown"
+        if next_game.start:
+            attrs[ATTR_NEXT_GAME_DATE] = next_game.start.strftime("%Y-%m-%d")
+            attrs[ATTR_NEXT_GAME_TIME] = next_game.start.strftime("%H:%M")
+        attrs[ATTR_NEXT_GAME_LOCATION] = next_game.location or "Unknown"
+        attrs[ATTR_NEXT_GAME_OPPONENT] = next_game.opponent or "Unknown"
+        attrs[ATTR_TEAM_ID] = next_game.team_id
+        if (summary := availability.get(next_game.id)) is not None:
+            attrs[ATTR_NEXT_GAME_AVAILABILITY] = summary._asdict()
+
+    # Add next practice attributes
+    if next_practice:
+        attrs[ATTR_NEXT_PRACTICE] = next_practice.name or "Unknown"
+        attrs[ATTR_TEAM_ID] = next_practice.team_id
+        if (summary := availability.get(next_practice.id)) is not None:
+            attrs[ATTR_NEXT_PRACTICE_AVAILABILITY] = summary._asdict()
+
+    # Add team information for the team the events belong to
+    team = teams_by_id.get(attrs.get(ATTR_TEAM_ID)) or default_team
+    if team and isinstance(team, dict):
+        attrs[ATTR_TEAM_NAME] = team.get("name", "Unknown")
+
+    attrs[ATTR_UPCOMING_EVENTS] = upcoming
+
+    return attrs